@@ -1,21 +1,37 @@
 """Main Streamlit application."""
 
+from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+from python_coding_test.streamlit import pages
 from python_coding_test.streamlit.components.sidebar import render_sidebar
 from python_coding_test.streamlit.config import AppConfig
-from python_coding_test.streamlit.pages import (
-    render_data_analysis_page,
-    render_home_page,
-    render_settings_page,
-    render_visualization_page,
-)
 from python_coding_test.utils.logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
+
+@st.cache_resource(show_spinner=False)
+def _load_css(primary_color: str) -> str:
+    """Load the custom stylesheet as a ``<style>`` block.
+
+    Parameters
+    ----------
+    primary_color : str
+        Theme primary color substituted for the ``{{PRIMARY}}`` placeholder
+
+    Returns
+    -------
+    str
+        HTML style block ready for ``st.markdown``
+    """
+    css = _CSS_PATH.read_text(encoding="utf-8").replace("{{PRIMARY}}", primary_color)
+    return f"<style>\n{css}</style>"
+
 
 def configure_page(config: AppConfig) -> None:
     """Configure Streamlit page settings.
@@ -33,46 +49,7 @@ def configure_page(config: AppConfig) -> None:
     )
 
     # カスタムCSS
-    st.markdown(
-        f"""
-        <style>
-        .main .block-container {{
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }}
-
-        .stSelectbox > div > div > div {{
-            background-color: white;
-        }}
-
-        /* カスタムカラー */
-        .stButton > button:first-child {{
-            background-color: {config.theme_primary_color};
-            color: white;
-            border: none;
-        }}
-
-        .stButton > button:first-child:hover {{
-            background-color: {config.theme_primary_color}dd;
-            color: white;
-        }}
-
-        /* メトリクス表示の改善 */
-        .metric-container {{
-            background-color: #f8f9fa;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            border-left: 4px solid {config.theme_primary_color};
-        }}
-
-        /* エラーメッセージのスタイル */
-        .stAlert > div {{
-            border-radius: 0.5rem;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_load_css(config.theme_primary_color), unsafe_allow_html=True)
 
 
 def route_to_page(
@@ -93,13 +70,13 @@ def route_to_page(
 
     try:
         if page_name == "home":
-            render_home_page(config, sidebar_state)
+            pages.render_home_page(config, sidebar_state)
         elif page_name == "data_analysis":
-            render_data_analysis_page(config, sidebar_state)
+            pages.render_data_analysis_page(config, sidebar_state)
         elif page_name == "visualization":
-            render_visualization_page(config, sidebar_state)
+            pages.render_visualization_page(config, sidebar_state)
         elif page_name == "settings":
-            render_settings_page(config, sidebar_state)
+            pages.render_settings_page(config, sidebar_state)
         else:
             st.error(f"❌ Unknown page: {page_name}")
             logger.error("Unknown page requested", page_name=page_name)
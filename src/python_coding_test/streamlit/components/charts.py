@@ -1,24 +1,97 @@
 """Chart components for Streamlit app."""
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
 import streamlit as st
 
 from python_coding_test.utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
 logger = get_logger(__name__)
 
+# チャート関数はStreamlitの再実行ごとに呼ばれるため、同じ入力の図はキャッシュする。
+# go.Figureはアンピクル時に再検証されるため、cache_dataではなくcache_resourceで
+# 同一オブジェクトを共有する（呼び出し側で図を変更しないこと）。
+# DataFrameは内容でハッシュされ、大きなフレームはサンプリングされる。
+
+# Plotly Expressと同様、この点数を超えるとWebGLトレースで描画する
+_WEBGL_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=1)
+def _go() -> Any:
+    """Import plotly.graph_objects on first use.
+
+    Plotly is slow to import, so it is deferred until a chart is actually
+    built instead of being paid at app startup (e.g. for the Settings page).
+    """
+    import plotly.graph_objects as go
+
+    return go
+
+
+@lru_cache(maxsize=1)
+def _px() -> Any:
+    """Import plotly.express on first use."""
+    import plotly.express as px
 
+    return px
+
+
+@lru_cache(maxsize=512)
+def _pretty(name: str) -> str:
+    """Format a column name as an axis title (e.g. "unit_price" -> "Unit Price")."""
+    return name.replace("_", " ").title()
+
+
+def _layout_spec(title: str, height: int, x_col: str, y_col: str) -> dict[str, Any]:
+    """Build the layout shared by the single-trace fast paths.
+
+    Parameters
+    ----------
+    title : str
+        Chart title
+    height : int
+        Chart height in pixels
+    x_col : str
+        Column name for x-axis
+    y_col : str
+        Column name for y-axis
+
+    Returns
+    -------
+    dict[str, Any]
+        Plotly layout specification
+    """
+    return {
+        "title": {"text": title},
+        "height": height,
+        "template": "plotly_white",
+        "xaxis": {"title": {"text": _pretty(x_col)}},
+        "yaxis": {"title": {"text": _pretty(y_col)}},
+        "showlegend": False,
+    }
+
+
+def _hover_template(x_col: str, y_col: str) -> str:
+    """Build the hover template Plotly Express would generate."""
+    return f"{x_col}=%{{x}}<br>{y_col}=%{{y}}<extra></extra>"
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
 def create_bar_chart(  # noqa: PLR0913
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     x_col: str,
     y_col: str,
     *,
     title: str = "Bar Chart",
     color_col: str | None = None,
     height: int = 400,
-) -> go.Figure:
+) -> "go.Figure":
     """Create an interactive bar chart.
 
     Parameters
@@ -39,7 +112,7 @@ def create_bar_chart(  # noqa: PLR0913
     Returns
     -------
     go.Figure
-        Plotly figure object
+        Plotly figure object (cached and shared; do not mutate)
     """
     logger.debug(
         "Creating bar chart",
@@ -50,21 +123,41 @@ def create_bar_chart(  # noqa: PLR0913
     )
 
     try:
-        fig = px.bar(
-            data,
-            x=x_col,
-            y=y_col,
-            color=color_col,
-            title=title,
-            height=height,
-            template="plotly_white",
-        )
-
-        fig.update_layout(
-            xaxis_title=x_col.replace("_", " ").title(),
-            yaxis_title=y_col.replace("_", " ").title(),
-            showlegend=color_col is not None,
-        )
+        if color_col is None:
+            # 単一トレースはPlotly Expressを経由せず、辞書から直接組み立てる
+            fig = _go().Figure(
+                {
+                    "data": [
+                        {
+                            "type": "bar",
+                            "x": data[x_col].to_numpy(),
+                            "y": data[y_col].to_numpy(),
+                            "hovertemplate": _hover_template(x_col, y_col),
+                        }
+                    ],
+                    # 同じxの棒はPlotly Expressと同様に積み上げる（未指定だと"group"）
+                    "layout": {
+                        **_layout_spec(title, height, x_col, y_col),
+                        "barmode": "relative",
+                    },
+                }
+            )
+        else:
+            fig = _px().bar(
+                data,
+                x=x_col,
+                y=y_col,
+                color=color_col,
+                title=title,
+                height=height,
+                template="plotly_white",
+            )
+
+            fig.update_layout(
+                xaxis_title=_pretty(x_col),
+                yaxis_title=_pretty(y_col),
+                showlegend=True,
+            )
 
         logger.debug("Bar chart created successfully")
         return fig
@@ -74,15 +167,16 @@ def create_bar_chart(  # noqa: PLR0913
         raise ValueError(f"Failed to create bar chart: {e}") from e
 
 
+@st.cache_resource(max_entries=16, show_spinner=False)
 def create_line_chart(  # noqa: PLR0913
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     x_col: str,
     y_col: str,
     *,
     title: str = "Line Chart",
     color_col: str | None = None,
     height: int = 400,
-) -> go.Figure:
+) -> "go.Figure":
     """Create an interactive line chart.
 
     Parameters
@@ -103,7 +197,7 @@ def create_line_chart(  # noqa: PLR0913
     Returns
     -------
     go.Figure
-        Plotly figure object
+        Plotly figure object (cached and shared; do not mutate)
     """
     logger.debug(
         "Creating line chart",
@@ -114,23 +208,48 @@ def create_line_chart(  # noqa: PLR0913
     )
 
     try:
-        fig = px.line(
-            data,
-            x=x_col,
-            y=y_col,
-            color=color_col,
-            title=title,
-            height=height,
-            template="plotly_white",
-        )
-
-        fig.update_layout(
-            xaxis_title=x_col.replace("_", " ").title(),
-            yaxis_title=y_col.replace("_", " ").title(),
-            showlegend=color_col is not None,
-        )
-
-        fig.update_traces(mode="lines+markers", line=dict(width=2), marker=dict(size=6))
+        if color_col is None:
+            # 単一トレースはPlotly Expressを経由せず、辞書から直接組み立てる
+            fig = _go().Figure(
+                {
+                    "data": [
+                        {
+                            "type": (
+                                "scattergl"
+                                if len(data) > _WEBGL_THRESHOLD
+                                else "scatter"
+                            ),
+                            "x": data[x_col].to_numpy(),
+                            "y": data[y_col].to_numpy(),
+                            "mode": "lines+markers",
+                            "line": {"width": 2},
+                            "marker": {"size": 6},
+                            "hovertemplate": _hover_template(x_col, y_col),
+                        }
+                    ],
+                    "layout": _layout_spec(title, height, x_col, y_col),
+                }
+            )
+        else:
+            fig = _px().line(
+                data,
+                x=x_col,
+                y=y_col,
+                color=color_col,
+                title=title,
+                height=height,
+                template="plotly_white",
+            )
+
+            fig.update_layout(
+                xaxis_title=_pretty(x_col),
+                yaxis_title=_pretty(y_col),
+                showlegend=True,
+            )
+
+            fig.update_traces(
+                mode="lines+markers", line=dict(width=2), marker=dict(size=6)
+            )
 
         logger.debug("Line chart created successfully")
         return fig
@@ -140,8 +259,9 @@ def create_line_chart(  # noqa: PLR0913
         raise ValueError(f"Failed to create line chart: {e}") from e
 
 
+@st.cache_resource(max_entries=16, show_spinner=False)
 def create_scatter_plot(  # noqa: PLR0913
-    data: pd.DataFrame,
+    data: "pd.DataFrame",
     x_col: str,
     y_col: str,
     *,
@@ -149,7 +269,7 @@ def create_scatter_plot(  # noqa: PLR0913
     color_col: str | None = None,
     size_col: str | None = None,
     height: int = 400,
-) -> go.Figure:
+) -> "go.Figure":
     """Create an interactive scatter plot.
 
     Parameters
@@ -172,7 +292,7 @@ def create_scatter_plot(  # noqa: PLR0913
     Returns
     -------
     go.Figure
-        Plotly figure object
+        Plotly figure object (cached and shared; do not mutate)
     """
     logger.debug(
         "Creating scatter plot",
@@ -184,24 +304,51 @@ def create_scatter_plot(  # noqa: PLR0913
     )
 
     try:
-        fig = px.scatter(
-            data,
-            x=x_col,
-            y=y_col,
-            color=color_col,
-            size=size_col,
-            title=title,
-            height=height,
-            template="plotly_white",
-        )
-
-        fig.update_layout(
-            xaxis_title=x_col.replace("_", " ").title(),
-            yaxis_title=y_col.replace("_", " ").title(),
-            showlegend=color_col is not None,
-        )
-
-        fig.update_traces(marker=dict(opacity=0.7, line=dict(width=1, color="white")))
+        if color_col is None and size_col is None:
+            # 単一トレースはPlotly Expressを経由せず、辞書から直接組み立てる
+            fig = _go().Figure(
+                {
+                    "data": [
+                        {
+                            "type": (
+                                "scattergl"
+                                if len(data) > _WEBGL_THRESHOLD
+                                else "scatter"
+                            ),
+                            "x": data[x_col].to_numpy(),
+                            "y": data[y_col].to_numpy(),
+                            "mode": "markers",
+                            "marker": {
+                                "opacity": 0.7,
+                                "line": {"width": 1, "color": "white"},
+                            },
+                            "hovertemplate": _hover_template(x_col, y_col),
+                        }
+                    ],
+                    "layout": _layout_spec(title, height, x_col, y_col),
+                }
+            )
+        else:
+            fig = _px().scatter(
+                data,
+                x=x_col,
+                y=y_col,
+                color=color_col,
+                size=size_col,
+                title=title,
+                height=height,
+                template="plotly_white",
+            )
+
+            fig.update_layout(
+                xaxis_title=_pretty(x_col),
+                yaxis_title=_pretty(y_col),
+                showlegend=color_col is not None,
+            )
+
+            fig.update_traces(
+                marker=dict(opacity=0.7, line=dict(width=1, color="white"))
+            )
 
         logger.debug("Scatter plot created successfully")
         return fig
@@ -211,41 +358,51 @@ def create_scatter_plot(  # noqa: PLR0913
         raise ValueError(f"Failed to create scatter plot: {e}") from e
 
 
-@st.cache_data  # type: ignore[misc]
-def load_sample_data() -> pd.DataFrame:
+@st.cache_resource(show_spinner=False)
+def load_sample_data() -> "pd.DataFrame":
     """Load sample data for demonstration.
 
+    The data is fixed, so a single instance is shared by every session
+    instead of being copied out of the cache on each call.
+
     Returns
     -------
     pd.DataFrame
-        Sample dataset
+        Sample dataset (cached and shared; do not mutate)
     """
     logger.debug("Loading sample data")
 
     import numpy as np
+    import pandas as pd
 
-    # サンプルデータの生成
-    np.random.seed(42)
+    # サンプルデータの生成（乱数は1つのGeneratorからまとめて生成する）
+    rng = np.random.default_rng(42)
     n_samples = 100
 
-    data = {
-        "date": pd.date_range("2024-01-01", periods=n_samples, freq="D"),
-        "sales": np.random.normal(1000, 200, n_samples).astype(int),
-        "profit": np.random.normal(150, 50, n_samples).astype(int),
-        "category": np.random.choice(["A", "B", "C"], n_samples),
-        "region": np.random.choice(["North", "South", "East", "West"], n_samples),
-        "customer_count": np.random.poisson(50, n_samples),
-    }
-
-    df = pd.DataFrame(data)
+    # 列0: 売上、列1: 利益のノイズ、列2: 満足度のノイズ
+    normals = rng.standard_normal((n_samples, 3))
 
     # 相関関係を作る
-    df["profit"] = (df["sales"] * 0.15 + np.random.normal(0, 30, n_samples)).astype(int)
-    df["satisfaction"] = np.clip(
-        (df["profit"] / df["sales"] * 100 * 5 + np.random.normal(0, 0.5, n_samples)),
+    sales = (1000 + 200 * normals[:, 0]).astype(np.int32)
+    profit = (sales * 0.15 + 30 * normals[:, 1]).astype(np.int32)
+    satisfaction = np.clip(
+        profit / sales * 100 * 5 + 0.5 * normals[:, 2],
         1,
         5,
     ).round(1)
 
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n_samples, freq="D"),
+            "sales": sales,
+            "profit": profit,
+            "category": rng.choice(["A", "B", "C"], n_samples),
+            "region": rng.choice(["North", "South", "East", "West"], n_samples),
+            "customer_count": rng.poisson(50, n_samples),
+            "satisfaction": satisfaction,
+        },
+        copy=False,
+    )
+
     logger.debug("Sample data loaded", shape=df.shape, columns=list(df.columns))
     return df
@@ -9,6 +9,60 @@ from python_coding_test.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# ページ表示に影響する設定（max_rows, enable_caching）の前回値を保持するキー
+_DISPLAY_SETTINGS_KEY = "_display_settings"
+
+
+@st.fragment
+def _render_theme_settings(config: AppConfig) -> None:
+    """Render the theme settings as a fragment.
+
+    Interacting with these widgets reruns only this fragment. The values
+    are read back from ``st.session_state`` by ``render_sidebar``; a full
+    rerun is triggered only when a setting the pages depend on changes.
+
+    Parameters
+    ----------
+    config : AppConfig
+        Application configuration
+    """
+    st.color_picker(
+        "Primary Color",
+        value=config.theme_primary_color,
+        help="Main accent color",
+        key="primary_color",
+    )
+
+    show_advanced = st.checkbox("Show Advanced Options", key="show_advanced")
+
+    if show_advanced:
+        max_rows = st.number_input(
+            "Max Rows to Display",
+            min_value=10,
+            max_value=10000,
+            value=1000,
+            step=100,
+            key="max_rows",
+        )
+
+        enable_caching = st.checkbox(
+            "Enable Data Caching",
+            value=True,
+            help="Cache processed data for better performance",
+            key="enable_caching",
+        )
+    else:
+        max_rows = 1000
+        enable_caching = True
+
+    display_settings = {"max_rows": max_rows, "enable_caching": enable_caching}
+    previous = st.session_state.get(_DISPLAY_SETTINGS_KEY)
+    st.session_state[_DISPLAY_SETTINGS_KEY] = display_settings
+
+    # ページの表示内容が変わる場合だけアプリ全体を再実行する
+    if previous is not None and previous != display_settings:
+        st.rerun()
+
 
 def render_sidebar(config: AppConfig) -> dict[str, Any]:
     """Render the sidebar with navigation and settings.
@@ -50,6 +104,7 @@ def render_sidebar(config: AppConfig) -> dict[str, Any]:
             "Choose a file",
             type=config.allowed_file_formats,
             help=f"Supported formats: {', '.join(config.allowed_file_formats or [])}",
+            key="uploaded_file",
         )
 
         # ファイル情報表示
@@ -68,35 +123,12 @@ def render_sidebar(config: AppConfig) -> dict[str, Any]:
             options=["DEBUG", "INFO", "WARNING", "ERROR"],
             index=1,  # INFO
             help="Set logging verbosity",
+            key="log_level",
         )
 
         # テーマ設定
         with st.expander("🎨 Theme Settings"):
-            primary_color = st.color_picker(
-                "Primary Color",
-                value=config.theme_primary_color,
-                help="Main accent color",
-            )
-
-            show_advanced = st.checkbox("Show Advanced Options")
-
-            if show_advanced:
-                max_rows = st.number_input(
-                    "Max Rows to Display",
-                    min_value=10,
-                    max_value=10000,
-                    value=1000,
-                    step=100,
-                )
-
-                enable_caching = st.checkbox(
-                    "Enable Data Caching",
-                    value=True,
-                    help="Cache processed data for better performance",
-                )
-            else:
-                max_rows = 1000
-                enable_caching = True
+            _render_theme_settings(config)
 
         st.divider()
 
@@ -111,9 +143,8 @@ def render_sidebar(config: AppConfig) -> dict[str, Any]:
         "selected_page": selected_page,
         "uploaded_file": uploaded_file,
         "log_level": log_level,
-        "primary_color": primary_color,
-        "max_rows": max_rows,
-        "enable_caching": enable_caching,
+        "primary_color": st.session_state["primary_color"],
+        **st.session_state[_DISPLAY_SETTINGS_KEY],
     }
 
     logger.debug(
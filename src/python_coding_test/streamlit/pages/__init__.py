@@ -1,9 +1,22 @@
 """Pages module for Streamlit app."""
 
-from .data_analysis import render_data_analysis_page
-from .home import render_home_page
-from .settings import render_settings_page
-from .visualization import render_visualization_page
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .data_analysis import render_data_analysis_page
+    from .home import render_home_page
+    from .settings import render_settings_page
+    from .visualization import render_visualization_page
+
+# データ系のページはpandasやpyarrowを読み込むため、最初に使われるまで
+# インポートしない（HomeやSettingsの初回表示を軽くする）
+_PAGE_MODULES = {
+    "render_data_analysis_page": ".data_analysis",
+    "render_home_page": ".home",
+    "render_settings_page": ".settings",
+    "render_visualization_page": ".visualization",
+}
 
 __all__ = [
     "render_data_analysis_page",
@@ -11,3 +24,10 @@ __all__ = [
     "render_settings_page",
     "render_visualization_page",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import page modules on first access."""
+    if name in _PAGE_MODULES:
+        return getattr(import_module(_PAGE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,166 @@
 """Data analysis page for Streamlit app."""
 
+import hashlib
 import io
+import json
+import math
+import os
+from datetime import timedelta
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pac
+import pyarrow.json as paj
 import streamlit as st
 
 from python_coding_test.streamlit.components.charts import load_sample_data
 from python_coding_test.streamlit.config import AppConfig
+from python_coding_test.utils.helpers import dump_json_bytes
 from python_coding_test.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 数値文字列の判定に使う先頭サンプルの行数
+_NUMERIC_PROBE_ROWS = 1000
+
+# 全件プレビュー時に1ページで表示する行数
+_PREVIEW_PAGE_SIZE = 50
+
+# キャッシュはセッションをまたいで共有されるため、閉じたタブのデータが
+# 残り続けないよう一定時間で破棄する
+_CACHE_TTL = timedelta(hours=1)
+
+
+def _read_csv(data: bytes) -> pd.DataFrame:
+    """Read CSV bytes with the pyarrow parser, falling back to pandas.
+
+    pandas is also used when the header has duplicate or blank names,
+    which pyarrow keeps as-is instead of renaming them.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw CSV content
+
+    Returns
+    -------
+    pd.DataFrame
+        Parsed data
+    """
+    try:
+        table = pac.read_csv(
+            pa.BufferReader(data),
+            parse_options=pac.ParseOptions(newlines_in_values=True),
+            convert_options=pac.ConvertOptions(strings_can_be_null=True),
+        )
+    except (pa.ArrowException, TypeError) as e:
+        logger.debug("pyarrow CSV reader failed, using pandas", error=str(e))
+        return pd.read_csv(io.BytesIO(data))
+    names = table.column_names
+    if "" in names or len(set(names)) != len(names):
+        # 重複・空の列名はpandasの命名規則（"a.1"、"Unnamed: 0"）に合わせる
+        return pd.read_csv(io.BytesIO(data))
+    # pandas互換のNumPy dtypeに変換（Arrow dtypeはPlotlyのグルーピングと相性が悪い）
+    return table.to_pandas(date_as_object=False)
+
+
+def _is_json_lines(data: bytes) -> bool:
+    """Return whether the content looks like newline-delimited JSON records."""
+    first_line, sep, rest = data.lstrip().partition(b"\n")
+    if not sep or not rest.strip() or not first_line.startswith(b"{"):
+        return False
+    try:
+        # 1行目だけで完結したオブジェクトになっていればJSON Linesとみなす
+        return isinstance(json.loads(first_line), dict)
+    except ValueError:
+        return False
+
+
+def _read_json(data: bytes) -> pd.DataFrame:
+    """Read JSON bytes, using the pyarrow parser for JSON Lines.
+
+    pyarrow only understands newline-delimited records and silently reads
+    other object-shaped documents as a single row, so regular JSON (arrays
+    and column- or index-oriented objects) is always read by pandas.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw JSON content
+
+    Returns
+    -------
+    pd.DataFrame
+        Parsed data
+    """
+    if not _is_json_lines(data):
+        return pd.read_json(io.BytesIO(data))
+    try:
+        table = paj.read_json(pa.BufferReader(data))
+        return table.to_pandas(date_as_object=False)
+    except (pa.ArrowException, TypeError) as e:
+        logger.debug("pyarrow JSON reader failed, using pandas", error=str(e))
+        return pd.read_json(io.BytesIO(data), lines=True)
+
+
+@st.cache_data(ttl=_CACHE_TTL, max_entries=4, show_spinner=False)
+def _parse_bytes(upload_key: str, suffix: str, _data: bytes) -> pd.DataFrame:
+    """Parse uploaded file content, cached on the upload key.
+
+    Streamlit reruns the page on every widget interaction; caching on the
+    upload key means an unchanged upload is parsed only once, and the raw
+    bytes (excluded from hashing by the leading underscore) are not
+    rehashed on each rerun. Each cache hit returns a fresh copy, so
+    callers may mutate the result freely. Entries expire after
+    ``_CACHE_TTL`` so parsed frames of finished sessions are not kept
+    alive indefinitely.
+
+    Parameters
+    ----------
+    upload_key : str
+        Identifier of the uploaded content
+    suffix : str
+        File extension including the dot (".csv" or ".json")
+    _data : bytes
+        Raw file content
+
+    Returns
+    -------
+    pd.DataFrame
+        Parsed data
+    """
+    if suffix == ".csv":
+        return _read_csv(_data)
+    return _read_json(_data)
+
+
+def _upload_key(uploaded_file: Any, data: bytes) -> str:
+    """Return a cache key identifying the uploaded content.
+
+    Streamlit assigns every upload a unique ``file_id``, so it identifies
+    the content without hashing the whole file. Objects without one fall
+    back to a digest of the content.
+
+    Parameters
+    ----------
+    uploaded_file : Any
+        Streamlit uploaded file object
+    data : bytes
+        Raw file content
+
+    Returns
+    -------
+    str
+        Cache key for the upload
+    """
+    file_id = getattr(uploaded_file, "file_id", None)
+    if file_id:
+        return f"{file_id}:{uploaded_file.name}"
+    return hashlib.sha256(data).hexdigest()
+
 
 def load_uploaded_data(uploaded_file: Any) -> pd.DataFrame | None:
     """Load data from uploaded file.
@@ -26,17 +175,20 @@ def load_uploaded_data(uploaded_file: Any) -> pd.DataFrame | None:
     pd.DataFrame | None
         Loaded data or None if error
     """
-    try:
-        if uploaded_file.name.endswith(".csv"):
-            df = pd.read_csv(uploaded_file)
-            logger.info("CSV file loaded", shape=df.shape, filename=uploaded_file.name)
-        elif uploaded_file.name.endswith(".json"):
-            df = pd.read_json(uploaded_file)
-            logger.info("JSON file loaded", shape=df.shape, filename=uploaded_file.name)
-        else:
-            st.error(f"Unsupported file format: {uploaded_file.name}")
-            return None
+    suffix = Path(uploaded_file.name).suffix.lower()
+    if suffix not in (".csv", ".json"):
+        st.error(f"Unsupported file format: {uploaded_file.name}")
+        return None
 
+    try:
+        data = uploaded_file.getvalue()
+        df = _parse_bytes(_upload_key(uploaded_file, data), suffix, data)
+        logger.info(
+            "File loaded",
+            shape=df.shape,
+            filename=uploaded_file.name,
+            format=suffix.lstrip("."),
+        )
         return df
 
     except Exception as e:
@@ -45,43 +197,215 @@ def load_uploaded_data(uploaded_file: Any) -> pd.DataFrame | None:
         return None
 
 
-def render_data_overview(df: pd.DataFrame) -> None:
+def _looks_numeric(sample: pd.Series) -> bool:
+    """Check whether every value in a non-null sample parses as a number.
+
+    String values are cast with the Arrow compute kernel; samples holding
+    other Python objects fall back to ``pd.to_numeric``.
+
+    Parameters
+    ----------
+    sample : pd.Series
+        Non-null values of an object column
+
+    Returns
+    -------
+    bool
+        True if all values are numeric
+    """
+    try:
+        strings = pc.utf8_trim_whitespace(pa.array(sample, type=pa.string()))
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # 文字列以外のオブジェクトが混在する場合はpandasで判定する
+        return bool(pd.to_numeric(sample, errors="coerce").notna().all())
+
+    try:
+        pc.cast(strings, pa.float64())
+    except pa.ArrowInvalid:
+        return False
+    return True
+
+
+def _find_numeric_text_columns(df: pd.DataFrame, object_cols: list[str]) -> list[str]:
+    """Find object columns whose values look numeric.
+
+    Only the first non-null values of each column are probed, so wide or
+    long frames are not converted in full just to produce a hint.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to check
+    object_cols : list[str]
+        Names of the object columns to probe
+
+    Returns
+    -------
+    list[str]
+        Names of object columns that contain numeric-looking text
+    """
+    numeric_text_cols = []
+    for col in object_cols:
+        sample = df[col].dropna().head(_NUMERIC_PROBE_ROWS)
+        if len(sample) > 0 and _looks_numeric(sample):
+            numeric_text_cols.append(col)
+    return numeric_text_cols
+
+
+def _describe_numeric(numeric: pd.DataFrame) -> pd.DataFrame:
+    """Compute the numeric summary, optionally with polars.
+
+    pandas is used by default. Setting the ``USE_POLARS`` environment
+    variable to ``1`` or ``true`` computes the statistics with polars'
+    multithreaded kernels instead, which only pays off on multi-core
+    machines; the result has the same rows and values as
+    ``DataFrame.describe()``. Without polars, or for frames it cannot
+    convert, pandas is used.
+
+    Parameters
+    ----------
+    numeric : pd.DataFrame
+        Numeric columns to summarize
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary statistics indexed by statistic name
+    """
+    if os.environ.get("USE_POLARS", "").lower() not in ("1", "true"):
+        return numeric.describe()
+
+    try:
+        import polars as pl
+    except ImportError:
+        return numeric.describe()
+
+    try:
+        summary = (
+            pl.from_pandas(numeric)
+            .describe(interpolation="linear")
+            .to_pandas()
+            .set_index("statistic")
+            # pandasのdescribe()には無い行なので除く
+            .drop(index="null_count")
+            .astype("float64")
+        )
+    except (pl.exceptions.PolarsError, TypeError, ValueError) as e:
+        logger.debug("polars describe failed, falling back to pandas", error=str(e))
+        return numeric.describe()
+
+    summary.index.name = None
+    # polarsは列名を文字列にするため、元の列名に戻す
+    summary.columns = numeric.columns
+    return summary
+
+
+@st.cache_data(ttl=_CACHE_TTL, max_entries=4, show_spinner=False)
+def compute_quality_stats(df: pd.DataFrame) -> dict[str, Any]:
+    """Compute the per-frame statistics shared by the analysis sections.
+
+    The overview, quality check and summary export all need the same
+    aggregates; computing them once per DataFrame avoids repeating the
+    full-frame scans on every section and every rerun.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to analyze
+
+    Returns
+    -------
+    dict[str, Any]
+        Overview metrics, column information, column groups by dtype, null
+        counts, numeric summary, duplicate count, unique counts and
+        numeric-looking text columns
+    """
+    null_per_col = df.isnull().sum()
+    # 列の型による振り分けは1回だけ行い、各セクションで共有する
+    numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+    categorical_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
+    object_cols = [col for col in categorical_cols if df[col].dtype == object]
+    nunique = df.nunique()
+
+    # 全行で値が異なる列（IDなど）があれば重複行は存在しないため、行全体の走査を省く
+    dupes = 0 if (nunique == len(df)).any() else int(df.duplicated().sum())
+
+    # 概要の4指標はここでまとめて求め、表示とエクスポートで共有する
+    overview = {
+        "total_rows": len(df),
+        "total_columns": len(df.columns),
+        # object列の中身まで辿るdeep=Trueは重いため、既定では浅い見積もりにする
+        "memory_usage_kb": float(df.memory_usage(deep=False).sum() / 1024),
+        # 欠損の総数は列ごとの集計から求め、フレームを再走査しない
+        "missing_values": int(null_per_col.sum()),
+    }
+
+    # 列情報の表は集計済みの値だけから組み立て、フレームを再走査しない
+    column_info = pd.DataFrame(
+        {
+            "Column": df.columns,
+            "Type": df.dtypes.astype(str),
+            "Non-Null Count": len(df) - null_per_col,
+            "Null Count": null_per_col,
+            "Unique Values": nunique,
+        }
+    )
+
+    return {
+        "overview": overview,
+        "column_info": column_info,
+        "numeric_cols": numeric_cols,
+        "categorical_cols": categorical_cols,
+        "null_per_col": null_per_col,
+        "null_total": overview["missing_values"],
+        "describe": (
+            _describe_numeric(df[numeric_cols]) if numeric_cols else pd.DataFrame()
+        ),
+        "dupes": dupes,
+        "nunique": nunique,
+        "numeric_text_cols": _find_numeric_text_columns(df, object_cols),
+    }
+
+
+def render_data_overview(df: pd.DataFrame, stats: dict[str, Any]) -> None:
     """Render data overview section.
 
     Parameters
     ----------
     df : pd.DataFrame
         Data to analyze
+    stats : dict[str, Any]
+        Precomputed statistics from compute_quality_stats
     """
     st.subheader("📋 Data Overview")
 
     col1, col2, col3, col4 = st.columns(4)
 
+    overview = stats["overview"]
+
     with col1:
-        st.metric("Total Rows", f"{len(df):,}")
+        st.metric("Total Rows", f"{overview['total_rows']:,}")
 
     with col2:
-        st.metric("Total Columns", f"{len(df.columns):,}")
+        st.metric("Total Columns", f"{overview['total_columns']:,}")
 
     with col3:
-        st.metric("Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB")
+        st.metric(
+            "Memory Usage",
+            f"{overview['memory_usage_kb']:.1f} KB",
+            help="Shallow estimate; object contents are not counted",
+        )
 
     with col4:
-        missing_values = df.isnull().sum().sum()
-        st.metric("Missing Values", f"{missing_values:,}")
+        st.metric("Missing Values", f"{overview['missing_values']:,}")
 
     # データ型情報
     with st.expander("📊 Column Information"):
-        col_info = pd.DataFrame(
-            {
-                "Column": df.columns,
-                "Type": df.dtypes.astype(str),
-                "Non-Null Count": df.count(),
-                "Null Count": df.isnull().sum(),
-                "Unique Values": df.nunique(),
-            }
-        )
-        st.dataframe(col_info, use_container_width=True)
+        if st.checkbox("Precise memory (slow)", key="precise_memory"):
+            precise_kb = df.memory_usage(deep=True).sum() / 1024
+            st.markdown(f"**Precise Memory Usage:** {precise_kb:,.1f} KB")
+
+        st.dataframe(stats["column_info"], use_container_width=True)
 
 
 def render_data_preview(df: pd.DataFrame, max_rows: int) -> None:
@@ -106,6 +430,10 @@ def render_data_preview(df: pd.DataFrame, max_rows: int) -> None:
             help="Choose how to preview the data",
         )
 
+    # 全件表示はページ単位で切り出し、表示中のページ分だけをブラウザに送る
+    page_size = min(_PREVIEW_PAGE_SIZE, max_rows)
+    n_pages = max(1, math.ceil(len(df) / page_size))
+
     with col2:
         if preview_mode != "All":
             n_rows = st.number_input(
@@ -116,7 +444,13 @@ def render_data_preview(df: pd.DataFrame, max_rows: int) -> None:
                 step=1,
             )
         else:
-            n_rows = len(df)
+            page = st.number_input(
+                "Page",
+                min_value=1,
+                max_value=n_pages,
+                value=1,
+                step=1,
+            )
 
     # データ表示
     if preview_mode == "Head":
@@ -126,64 +460,101 @@ def render_data_preview(df: pd.DataFrame, max_rows: int) -> None:
     elif preview_mode == "Sample":
         preview_df = df.sample(min(n_rows, len(df)))
     else:  # All
-        preview_df = df.head(max_rows)
+        start = (page - 1) * page_size
+        preview_df = df.iloc[start : start + page_size]
 
     st.dataframe(preview_df, use_container_width=True, height=400)
 
-    if len(df) > max_rows and preview_mode == "All":
-        st.warning(f"Showing first {max_rows:,} rows. Total rows: {len(df):,}")
+    if preview_mode == "All":
+        st.caption(
+            f"Page {page:,} of {n_pages:,} "
+            f"({page_size:,} rows per page, {len(df):,} rows total)"
+        )
+
+
+def _most_frequent(counts: pd.Series) -> Any:
+    """Return the most frequent value, breaking ties like ``Series.mode()``.
+
+    ``value_counts`` orders equally frequent values by first appearance,
+    while ``mode()`` returns them sorted, so the smallest of the tied
+    values is taken (in category order for categorical data).
 
+    Parameters
+    ----------
+    counts : pd.Series
+        Non-empty result of ``value_counts`` for one column
 
-def render_statistical_summary(df: pd.DataFrame) -> None:
+    Returns
+    -------
+    Any
+        Most frequent value
+    """
+    top = counts.index[counts.to_numpy() == counts.iloc[0]]
+    try:
+        return top.sort_values()[0]
+    except TypeError:
+        # 比較できない混在型の値はvalue_countsの順のまま先頭を使う
+        return top[0]
+
+
+def render_statistical_summary(df: pd.DataFrame, stats: dict[str, Any]) -> None:
     """Render statistical summary section.
 
     Parameters
     ----------
     df : pd.DataFrame
         Data to analyze
+    stats : dict[str, Any]
+        Precomputed statistics from compute_quality_stats
     """
     st.subheader("📊 Statistical Summary")
 
     # 数値列の統計
-    numeric_cols = df.select_dtypes(include=["number"]).columns
-    if len(numeric_cols) > 0:
+    if not stats["describe"].empty:
         st.markdown("**Numeric Columns:**")
-        st.dataframe(df[numeric_cols].describe(), use_container_width=True)
+        st.dataframe(stats["describe"], use_container_width=True)
 
     # カテゴリカル列の統計
-    categorical_cols = df.select_dtypes(include=["object", "category"]).columns
-    if len(categorical_cols) > 0:
+    categorical_cols = stats["categorical_cols"]
+    if categorical_cols:
         st.markdown("**Categorical Columns:**")
+        # 列ごとにvalue_countsを1回だけ計算し、ユニーク数・最頻値・頻度に使い回す
+        # （category型の未使用カテゴリは件数0で含まれるため除外する）
+        value_counts = {}
+        for col in categorical_cols:
+            vc = df[col].value_counts()
+            value_counts[col] = vc[vc > 0]
         cat_summary = pd.DataFrame(
             {
                 "Column": categorical_cols,
-                "Unique Values": [df[col].nunique() for col in categorical_cols],
+                "Unique Values": [len(vc) for vc in value_counts.values()],
                 "Most Frequent": [
-                    df[col].mode().iloc[0] if len(df[col].mode()) > 0 else "N/A"
-                    for col in categorical_cols
+                    _most_frequent(vc) if len(vc) > 0 else "N/A"
+                    for vc in value_counts.values()
                 ],
                 "Frequency": [
-                    df[col].value_counts().iloc[0] if len(df[col]) > 0 else 0
-                    for col in categorical_cols
+                    vc.iloc[0] if len(vc) > 0 else 0 for vc in value_counts.values()
                 ],
             }
         )
         st.dataframe(cat_summary, use_container_width=True)
 
 
-def render_data_quality_check(df: pd.DataFrame) -> None:
+def render_data_quality_check(df: pd.DataFrame, stats: dict[str, Any]) -> None:
     """Render data quality check section.
 
     Parameters
     ----------
     df : pd.DataFrame
         Data to check
+    stats : dict[str, Any]
+        Precomputed statistics from compute_quality_stats
     """
     st.subheader("🔍 Data Quality Check")
 
     # 欠損値分析
-    missing_data = df.isnull().sum()
-    if missing_data.sum() > 0:
+    missing_data = stats["null_per_col"]
+    if stats["null_total"] > 0:
         st.markdown("**Missing Values by Column:**")
         missing_df = pd.DataFrame(
             {
@@ -198,7 +569,7 @@ def render_data_quality_check(df: pd.DataFrame) -> None:
         st.success("✅ No missing values found!")
 
     # 重複行チェック
-    duplicates = df.duplicated().sum()
+    duplicates = stats["dupes"]
     if duplicates > 0:
         st.warning(f"⚠️ Found {duplicates:,} duplicate rows")
     else:
@@ -206,19 +577,11 @@ def render_data_quality_check(df: pd.DataFrame) -> None:
 
     # データ型の整合性チェック
     with st.expander("🔧 Data Type Analysis"):
-        type_issues = []
-
-        for col in df.columns:
-            if df[col].dtype == "object":
-                # 数値のような文字列をチェック
-                try:
-                    pd.to_numeric(df[col], errors="raise")
-                    type_issues.append(
-                        f"Column '{col}' contains numeric data but is stored "
-                        f"as text"
-                    )
-                except (ValueError, TypeError):
-                    pass
+        # 数値のような文字列をチェック
+        type_issues = [
+            f"Column '{col}' contains numeric data but is stored as text"
+            for col in stats["numeric_text_cols"]
+        ]
 
         if type_issues:
             for issue in type_issues:
@@ -227,6 +590,48 @@ def render_data_quality_check(df: pd.DataFrame) -> None:
             st.success("✅ Data types look good!")
 
 
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as CSV bytes for download.
+
+    pandas writes straight into a byte buffer, so no intermediate Python
+    string is built, and the output matches ``df.to_csv(index=False)``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to export
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded CSV content
+    """
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _to_json_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as a JSON array of records for download.
+
+    The output is written straight into a byte buffer and can be uploaded
+    again as a ``.json`` file.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to export
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON content
+    """
+    buffer = io.BytesIO()
+    df.to_json(buffer, orient="records", indent=2)
+    return buffer.getvalue()
+
+
 def render_data_analysis_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
     """Render the data analysis page.
 
@@ -266,10 +671,12 @@ def render_data_analysis_page(config: AppConfig, sidebar_state: dict[str, Any])
 
     # データ分析の実行
     if df is not None:
+        stats = compute_quality_stats(df)
+
         st.divider()
 
         # データ概要
-        render_data_overview(df)
+        render_data_overview(df, stats)
 
         st.divider()
 
@@ -279,12 +686,12 @@ def render_data_analysis_page(config: AppConfig, sidebar_state: dict[str, Any])
         st.divider()
 
         # 統計サマリー
-        render_statistical_summary(df)
+        render_statistical_summary(df, stats)
 
         st.divider()
 
         # データ品質チェック
-        render_data_quality_check(df)
+        render_data_quality_check(df, stats)
 
         st.divider()
 
@@ -295,22 +702,18 @@ def render_data_analysis_page(config: AppConfig, sidebar_state: dict[str, Any])
 
         with col1:
             if st.button("📄 Export CSV"):
-                csv_buffer = io.StringIO()
-                df.to_csv(csv_buffer, index=False)
                 st.download_button(
                     "Download CSV",
-                    csv_buffer.getvalue(),
+                    _to_csv_bytes(df),
                     "analyzed_data.csv",
                     "text/csv",
                 )
 
         with col2:
             if st.button("📋 Export JSON"):
-                json_buffer = io.StringIO()
-                df.to_json(json_buffer, orient="records", indent=2)
                 st.download_button(
                     "Download JSON",
-                    json_buffer.getvalue(),
+                    _to_json_bytes(df),
                     "analyzed_data.json",
                     "application/json",
                 )
@@ -318,29 +721,15 @@ def render_data_analysis_page(config: AppConfig, sidebar_state: dict[str, Any])
         with col3:
             if st.button("📊 Export Summary"):
                 summary_data = {
-                    "overview": {
-                        "total_rows": len(df),
-                        "total_columns": len(df.columns),
-                        "memory_usage_kb": df.memory_usage(deep=True).sum() / 1024,
-                        "missing_values": df.isnull().sum().sum(),
-                    },
+                    "overview": stats["overview"],
                     "columns": df.dtypes.astype(str).to_dict(),
-                    "missing_values": df.isnull().sum().to_dict(),
-                    "numeric_summary": (
-                        df.describe().to_dict()
-                        if len(df.select_dtypes(include=["number"]).columns) > 0
-                        else {}
-                    ),
+                    "missing_values": stats["null_per_col"].to_dict(),
+                    "numeric_summary": stats["describe"].to_dict(),
                 }
 
-                summary_json = io.StringIO()
-                import json
-
-                json.dump(summary_data, summary_json, indent=2)
-
                 st.download_button(
                     "Download Summary",
-                    summary_json.getvalue(),
+                    dump_json_bytes(summary_data),
                     "data_summary.json",
                     "application/json",
                 )
@@ -24,7 +24,7 @@ def render_home_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
 
     # ヘッダー
     st.title("🏠 Welcome to Python Coding Test")
-    st.markdown(
+    st.html(
         """
         <div style='padding: 1rem; background-color: #f0f2f6;
                     border-radius: 10px; margin-bottom: 2rem;'>
@@ -36,8 +36,7 @@ def render_home_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
                 interactive tools powered by Streamlit.
             </p>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
     # 機能紹介
@@ -116,10 +115,11 @@ def render_home_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
 
     col1, col2 = st.columns([1, 1])
 
+    # 見出しと一覧は1つのmarkdown要素にまとめて送る
     with col1:
-        st.markdown("### ℹ️ System Info")
         st.markdown(
             f"""
+            ### ℹ️ System Info
             - **App Version:** 0.1.0
             - **Layout:** {config.layout.title()}
             - **Max Upload:** {config.max_upload_size_mb} MB
@@ -128,9 +128,9 @@ def render_home_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
         )
 
     with col2:
-        st.markdown("### 🔧 Tech Stack")
         st.markdown(
             """
+            ### 🔧 Tech Stack
             - **Frontend:** Streamlit
             - **Data:** Pandas, NumPy
             - **Visualization:** Plotly, Matplotlib
@@ -140,15 +140,14 @@ def render_home_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
 
     # フッター
     st.markdown("---")
-    st.markdown(
+    st.html(
         """
         <div style='text-align: center; color: #666; font-size: 0.9rem;'>
             Built with ❤️ using <strong>Python</strong> and
             <strong>Streamlit</strong><br>
             Powered by <strong>Claude Code</strong> development workflow
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
     logger.debug("Home page rendered successfully")
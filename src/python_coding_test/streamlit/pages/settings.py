@@ -5,10 +5,26 @@ from typing import Any
 import streamlit as st
 
 from python_coding_test.streamlit.config import AppConfig
+from python_coding_test.utils.helpers import dump_json_bytes, load_json_bytes
 from python_coding_test.utils.logging_config import get_logger, set_log_level
 
 logger = get_logger(__name__)
 
+# 選択肢は再実行のたびに作り直さず、インデックスも辞書で引く
+_LAYOUT_MODES = ("wide", "centered")
+_LAYOUT_MODE_INDEX = {mode: i for i, mode in enumerate(_LAYOUT_MODES)}
+
+_SIDEBAR_STATES = ("expanded", "collapsed", "auto")
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LOG_LEVEL_INDEX = {level: i for i, level in enumerate(_LOG_LEVELS)}
+
+_UPLOAD_FORMATS = ("csv", "json", "xlsx", "parquet")
+_EXPORT_FORMATS = ("csv", "json", "xlsx")
+
+_CHART_THEMES = ("plotly", "plotly_white", "plotly_dark", "ggplot2", "seaborn")
+_CHART_THEME_INDEX = {theme: i for i, theme in enumerate(_CHART_THEMES)}
+
 
 def render_settings_page(  # noqa: PLR0915
     config: AppConfig, sidebar_state: dict[str, Any]
@@ -44,14 +60,14 @@ def render_settings_page(  # noqa: PLR0915
 
         layout_mode = st.selectbox(
             "Layout Mode",
-            ["wide", "centered"],
-            index=0 if config.layout == "wide" else 1,
+            _LAYOUT_MODES,
+            index=_LAYOUT_MODE_INDEX.get(config.layout, _LAYOUT_MODE_INDEX["centered"]),
             help="Page layout configuration",
         )
 
         sidebar_state_option = st.selectbox(
             "Sidebar Default State",
-            ["expanded", "collapsed", "auto"],
+            _SIDEBAR_STATES,
             index=0,
             help="Default state of the sidebar",
         )
@@ -94,14 +110,8 @@ def render_settings_page(  # noqa: PLR0915
     with col1:
         current_log_level = st.selectbox(
             "Application Log Level",
-            ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-            index=[
-                "DEBUG",
-                "INFO",
-                "WARNING",
-                "ERROR",
-                "CRITICAL",
-            ].index(sidebar_state.get("log_level", "INFO")),
+            _LOG_LEVELS,
+            index=_LOG_LEVEL_INDEX[sidebar_state.get("log_level", "INFO")],
             help="Set the verbosity of application logging",
         )
 
@@ -145,7 +155,7 @@ def render_settings_page(  # noqa: PLR0915
 
         supported_formats = st.multiselect(
             "File Formats",
-            ["csv", "json", "xlsx", "parquet"],
+            _UPLOAD_FORMATS,
             default=config.allowed_file_formats,
             help="File formats allowed for upload",
         )
@@ -162,7 +172,7 @@ def render_settings_page(  # noqa: PLR0915
 
         default_export_format = st.selectbox(
             "Default Export Format",
-            ["csv", "json", "xlsx"],
+            _EXPORT_FORMATS,
             help="Default format for data exports",
         )
 
@@ -194,8 +204,8 @@ def render_settings_page(  # noqa: PLR0915
 
         chart_theme = st.selectbox(
             "Chart Theme",
-            ["plotly", "plotly_white", "plotly_dark", "ggplot2", "seaborn"],
-            index=1,  # plotly_white
+            _CHART_THEMES,
+            index=_CHART_THEME_INDEX["plotly_white"],
             help="Default theme for charts",
         )
 
@@ -224,19 +234,34 @@ def render_settings_page(  # noqa: PLR0915
 
     col1, col2 = st.columns(2)
 
+    # 各列の見出しと一覧は1つのmarkdown要素にまとめて送る
     with col1:
-        st.markdown("**📦 Application Info**")
-        st.markdown("- **Version:** 0.1.0")
-        st.markdown("- **Python:** 3.12+")
-        st.markdown(f"- **Streamlit:** {st.__version__}")
-        st.markdown(f"- **Layout:** {config.layout}")
+        st.markdown(
+            "\n".join(
+                [
+                    "**📦 Application Info**",
+                    "",
+                    "- **Version:** 0.1.0",
+                    "- **Python:** 3.12+",
+                    f"- **Streamlit:** {st.__version__}",
+                    f"- **Layout:** {config.layout}",
+                ]
+            )
+        )
 
     with col2:
-        st.markdown("**💾 Current Settings**")
-        st.markdown(f"- **Log Level:** {current_log_level}")
-        st.markdown(f"- **Max Upload:** {max_upload_size} MB")
-        st.markdown(f"- **Max Rows:** {max_display_rows:,}")
-        st.markdown(f"- **Caching:** {'Enabled' if enable_caching else 'Disabled'}")
+        st.markdown(
+            "\n".join(
+                [
+                    "**💾 Current Settings**",
+                    "",
+                    f"- **Log Level:** {current_log_level}",
+                    f"- **Max Upload:** {max_upload_size} MB",
+                    f"- **Max Rows:** {max_display_rows:,}",
+                    f"- **Caching:** {'Enabled' if enable_caching else 'Disabled'}",
+                ]
+            )
+        )
 
     st.divider()
 
@@ -250,7 +275,8 @@ def render_settings_page(  # noqa: PLR0915
             # セッション状態をクリア
             for key in list(st.session_state.keys()):
                 if isinstance(key, str) and (
-                    key.startswith("filter_") or key in ["sample_data"]
+                    key.startswith("filter_")
+                    or key in ["sample_data_loaded", "_last_mask", "_df_cache"]
                 ):
                     del st.session_state[key]
             st.success("✅ Settings reset to defaults")
@@ -259,6 +285,7 @@ def render_settings_page(  # noqa: PLR0915
     with col2:
         if st.button("🗑️ Clear Cache", type="secondary"):
             st.cache_data.clear()
+            st.cache_resource.clear()
             st.success("✅ Cache cleared")
 
     with col3:
@@ -293,13 +320,9 @@ def render_settings_page(  # noqa: PLR0915
                 },
             }
 
-            import json
-
-            settings_json = json.dumps(settings_export, indent=2)
-
             st.download_button(
                 "Download Settings",
-                settings_json,
+                dump_json_bytes(settings_export),
                 "app_settings.json",
                 "application/json",
             )
@@ -313,9 +336,7 @@ def render_settings_page(  # noqa: PLR0915
 
         if uploaded_settings is not None:
             try:
-                import json
-
-                imported_settings = json.load(uploaded_settings)
+                imported_settings = load_json_bytes(uploaded_settings.getvalue())
                 st.success("✅ Settings imported successfully!")
                 with st.expander("📋 Imported Settings"):
                     st.json(imported_settings)
@@ -324,15 +345,14 @@ def render_settings_page(  # noqa: PLR0915
 
     # フッター
     st.markdown("---")
-    st.markdown(
+    st.html(
         """
         <div style='text-align: center; color: #666; font-size: 0.9rem;'>
             💡 <strong>Tip:</strong> Changes to most settings take effect
             immediately.<br>
             Some changes may require refreshing the page or reloading data.
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
     logger.debug("Settings page rendered successfully")
@@ -1,7 +1,9 @@
 """Visualization page for Streamlit app."""
 
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -17,6 +19,80 @@ from python_coding_test.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# フィルタ用のマルチセレクトを表示するユニーク値数の上限
+_FILTER_MAX_UNIQUE = 20
+
+# 文字列列をカテゴリ型に変換するユニーク値数の下限値（行数の2%とのうち大きい方）
+_CATEGORY_MIN_LIMIT = 32
+
+# 最後に適用したフィルタ条件とマスクを保持するセッションキー
+_LAST_MASK_KEY = "_last_mask"
+
+# サンプルデータを読み込み済みかを示すセッションキー
+_SAMPLE_LOADED_KEY = "sample_data_loaded"
+
+# 折れ線グラフ・散布図でブラウザへ送る点数の上限
+PLOT_LIMIT = 20_000
+
+# チャート種別ごとの図の生成関数
+_CHART_BUILDERS: dict[str, Callable[..., Any]] = {
+    "Bar Chart": create_bar_chart,
+    "Line Chart": create_line_chart,
+    "Scatter Plot": create_scatter_plot,
+}
+
+# PLOT_LIMITまで間引いて描画するチャート種別
+_SAMPLED_CHART_TYPES = frozenset({"Line Chart", "Scatter Plot"})
+
+# 読み込み済みのアップロードデータを保持するセッションキー
+_DF_CACHE_KEY = "_df_cache"
+
+# エクスポート形式ごとのボタン名、ダウンロードボタン名、MIMEタイプ、画像サイズ
+_EXPORT_SPECS: dict[str, tuple[str, str, str, dict[str, int]]] = {
+    "png": (
+        "📷 Export PNG",
+        "Download PNG",
+        "image/png",
+        {"width": 1200, "height": 800},
+    ),
+    "svg": ("🖼️ Export SVG", "Download SVG", "image/svg+xml", {}),
+    "html": ("📄 Export HTML", "Download HTML", "text/html", {}),
+}
+
+
+def _get_df(uploaded_file: Any) -> pd.DataFrame | None:
+    """Return the parsed upload, reusing this session's frame across reruns.
+
+    ``load_uploaded_data`` parses each upload only once, but every call
+    still unpickles a fresh copy from ``st.cache_data``. The frame of the
+    current upload is therefore kept in the session state under the
+    upload's ``file_id``, and later reruns return it directly. Only the
+    latest upload is kept, and failed loads are not stored so that their
+    error message is shown again.
+
+    Parameters
+    ----------
+    uploaded_file : Any
+        Streamlit uploaded file object, or None
+
+    Returns
+    -------
+    pd.DataFrame | None
+        Loaded data, or None if there is no upload or it failed to load
+    """
+    if uploaded_file is None:
+        return None
+
+    file_id = getattr(uploaded_file, "file_id", None)
+    cached = st.session_state.get(_DF_CACHE_KEY)
+    if file_id and cached is not None and cached[0] == file_id:
+        return cached[1]
+
+    df = load_uploaded_data(uploaded_file)
+    if file_id and df is not None:
+        st.session_state[_DF_CACHE_KEY] = (file_id, df)
+    return df
+
 
 def get_chart_data(sidebar_state: dict[str, Any]) -> pd.DataFrame | None:
     """Get data for charting.
@@ -32,25 +108,24 @@ def get_chart_data(sidebar_state: dict[str, Any]) -> pd.DataFrame | None:
         Data for charting or None if no data
     """
     # まずアップロードされたファイルをチェック
-    if sidebar_state["uploaded_file"] is not None:
-        df = load_uploaded_data(sidebar_state["uploaded_file"])
-        if df is not None:
-            return df
+    df = _get_df(sidebar_state["uploaded_file"])
+    if df is not None:
+        return df
 
-    # セッション状態にサンプルデータがあるかチェック
-    if "sample_data" in st.session_state:
-        return st.session_state.sample_data
+    # サンプルデータが読み込み済みかチェック
+    if st.session_state.get(_SAMPLE_LOADED_KEY):
+        return load_sample_data()
 
     return None
 
 
-def render_chart_controls(df: pd.DataFrame) -> dict[str, Any]:
+def render_chart_controls(meta: dict[str, Any]) -> dict[str, Any]:
     """Render chart configuration controls.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Data for charting
+    meta : dict[str, Any]
+        Column metadata from _filter_meta
 
     Returns
     -------
@@ -62,13 +137,13 @@ def render_chart_controls(df: pd.DataFrame) -> dict[str, Any]:
     # チャートタイプ選択
     chart_type = st.selectbox(
         "Chart Type",
-        ["Bar Chart", "Line Chart", "Scatter Plot"],
+        list(_CHART_BUILDERS),
         help="Select the type of chart to create",
     )
 
-    # 列選択
-    numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
-    all_cols = df.columns.tolist()
+    # 列選択（列の一覧はデータごとにキャッシュ済みのものを使う）
+    numeric_cols = meta["numeric_cols"]
+    all_cols = meta["all_cols"]
 
     col1, col2 = st.columns(2)
 
@@ -127,13 +202,102 @@ def render_chart_controls(df: pd.DataFrame) -> dict[str, Any]:
     }
 
 
-def render_data_filtering(df: pd.DataFrame) -> pd.DataFrame:
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store columns in the most compact dtype that keeps every value.
+
+    Integer columns are downcast to the smallest integer type; float
+    columns become float32 only when no value changes; low-cardinality
+    object columns become ``category`` so that filtering compares integer
+    codes instead of hashing strings. Smaller columns mean less memory
+    traffic when building filter masks and smaller figure payloads. The
+    result is shared between reruns (cache_resource), so callers must not
+    modify it.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Loaded data
+
+    Returns
+    -------
+    pd.DataFrame
+        Data with compact column dtypes
+    """
+    out = df.copy()
+
+    for col in out.select_dtypes(include=["integer"]).columns:
+        out[col] = pd.to_numeric(out[col], downcast="integer")
+
+    for col in out.select_dtypes(include=["float64"]).columns:
+        values = out[col].to_numpy()
+        narrowed = values.astype(np.float32)
+        # 値が変わる列（精度が落ちる列）はfloat64のまま残す
+        if np.array_equal(narrowed, values, equal_nan=True):
+            out[col] = narrowed
+
+    # ユニーク値が少ない文字列列はカテゴリ型にし、isinを整数コードの比較にする
+    max_categories = max(_CATEGORY_MIN_LIMIT, len(out) // 50)
+    for col in out.select_dtypes(include=["object"]).columns:
+        if out[col].nunique() <= max_categories:
+            out[col] = out[col].astype("category")
+
+    return out
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _filter_meta(df: pd.DataFrame) -> dict[str, Any]:
+    """Compute the column metadata the filter and chart widgets are built from.
+
+    The column lists, ranges and unique values depend only on the data, so
+    they are computed once per DataFrame instead of scanning every column
+    on each rerun.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Original data
+
+    Returns
+    -------
+    dict[str, Any]
+        ``"all_cols"`` and ``"numeric_cols"`` list the column names;
+        ``"numeric"`` maps column names to ``(min, max, step)`` slider
+        parameters for columns with a value range; ``"categorical"`` maps
+        column names to their unique values for columns with at most
+        ``_FILTER_MAX_UNIQUE`` of them
+    """
+    numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+
+    numeric = {}
+    for col in numeric_cols:
+        min_val, max_val = float(df[col].min()), float(df[col].max())
+        if min_val != max_val:  # 値に幅がある場合のみ
+            # スライダーの刻み幅は範囲の1/100
+            numeric[col] = (min_val, max_val, (max_val - min_val) / 100)
+
+    categorical = {}
+    for col in df.select_dtypes(include=["object", "category"]).columns:
+        if df[col].nunique() <= _FILTER_MAX_UNIQUE:
+            categorical[col] = df[col].unique().tolist()
+
+    return {
+        "all_cols": df.columns.tolist(),
+        "numeric_cols": numeric_cols,
+        "numeric": numeric,
+        "categorical": categorical,
+    }
+
+
+def render_data_filtering(df: pd.DataFrame, meta: dict[str, Any]) -> pd.DataFrame:
     """Render data filtering controls and return filtered data.
 
     Parameters
     ----------
     df : pd.DataFrame
         Original data
+    meta : dict[str, Any]
+        Column metadata from _filter_meta
 
     Returns
     -------
@@ -143,40 +307,48 @@ def render_data_filtering(df: pd.DataFrame) -> pd.DataFrame:
     with st.expander("🔍 Data Filtering"):
         st.markdown("Filter your data before creating charts:")
 
-        filtered_df = df.copy()
-
-        # 数値列のフィルタリング
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-        for col in numeric_cols:
-            if col in df.columns:
-                min_val, max_val = float(df[col].min()), float(df[col].max())
-                if min_val != max_val:  # 値に幅がある場合のみ
-                    selected_range = st.slider(
-                        f"{col} Range",
-                        min_value=min_val,
-                        max_value=max_val,
-                        value=(min_val, max_val),
-                        step=(max_val - min_val) / 100,
-                        key=f"filter_{col}",
-                    )
-                    filtered_df = filtered_df[
-                        (filtered_df[col] >= selected_range[0])
-                        & (filtered_df[col] <= selected_range[1])
-                    ]
-
-        # カテゴリカル列のフィルタリング
-        categorical_cols = df.select_dtypes(include=["object", "category"]).columns
-        for col in categorical_cols:
-            if col in df.columns and df[col].nunique() <= 20:  # 20以下のユニーク値
-                unique_values = df[col].unique().tolist()
-                selected_values: list[str] = st.multiselect(
+        # フォーム内のウィジェット操作では再実行せず、Apply時にまとめて反映する
+        with st.form("data_filter_form"):
+            ranges = {
+                col: st.slider(
+                    f"{col} Range",
+                    min_value=min_val,
+                    max_value=max_val,
+                    value=(min_val, max_val),
+                    step=step,
+                    key=f"filter_{col}",
+                )
+                for col, (min_val, max_val, step) in meta["numeric"].items()
+            }
+            selections: dict[str, list[str]] = {
+                col: st.multiselect(
                     f"{col} Values",
                     unique_values,
                     default=unique_values,
                     key=f"filter_cat_{col}",
                 )
-                if selected_values:
-                    filtered_df = filtered_df[filtered_df[col].isin(selected_values)]
+                for col, unique_values in meta["categorical"].items()
+            }
+            st.form_submit_button("Apply Filters")
+
+        # 全ての値が選択されている列は行を除外しないため、マスクの計算から外す
+        selections = {
+            col: selected_values
+            for col, selected_values in selections.items()
+            if len(selected_values) != len(meta["categorical"][col])
+        }
+
+        # 同じデータと条件で作成済みのマスクがあれば再利用する
+        applied = (ranges, selections)
+        last = st.session_state.get(_LAST_MASK_KEY)
+        if last is not None and last[0] is df and last[1] == applied:
+            mask = last[2]
+        else:
+            mask = _build_mask(df, ranges, selections)
+            st.session_state[_LAST_MASK_KEY] = (df, applied, mask)
+
+        # 全行が残る場合はコピーを作らず元のデータをそのまま使う
+        filtered_df = df if mask.all() else df[mask]
 
         if len(filtered_df) != len(df):
             st.info(
@@ -187,9 +359,226 @@ def render_data_filtering(df: pd.DataFrame) -> pd.DataFrame:
         return filtered_df
 
 
-def render_visualization_page(  # noqa: PLR0912, PLR0915
-    config: AppConfig, sidebar_state: dict[str, Any]
-) -> None:
+def _build_mask(
+    df: pd.DataFrame,
+    ranges: dict[str, tuple[float, float]],
+    selections: dict[str, list[str]],
+) -> np.ndarray:
+    """Combine the applied filter conditions into one row mask.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Original data
+    ranges : dict[str, tuple[float, float]]
+        Selected (min, max) range for each numeric column
+    selections : dict[str, list[str]]
+        Selected values for each categorical column
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the rows that pass every filter
+    """
+    # 列ごとの条件は1つのマスクにまとめ、最後に1回だけ行を抽出する
+    mask = np.ones(len(df), dtype=bool)
+
+    # 数値列のフィルタリング
+    for col, (low, high) in ranges.items():
+        series = df[col]
+        # NumPy型の列はそのままの型で比較し、float64へのコピーを作らない
+        values = (
+            series.to_numpy()
+            if isinstance(series.dtype, np.dtype)
+            else series.to_numpy(dtype=float, na_value=np.nan)
+        )
+        mask &= (values >= low) & (values <= high)
+
+    # カテゴリカル列のフィルタリング
+    for col, selected_values in selections.items():
+        if selected_values:
+            mask &= df[col].isin(selected_values).to_numpy()
+
+    return mask
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _export_bytes(
+    fig_json: str, fmt: str, width: int | None = None, height: int | None = None
+) -> bytes:
+    """Render a figure to an export format, cached on the figure JSON.
+
+    Image rendering through Kaleido takes seconds for large figures, so
+    repeated exports of an unchanged chart reuse the previous result.
+
+    Parameters
+    ----------
+    fig_json : str
+        Figure serialized with ``Figure.to_json()``
+    fmt : str
+        Export format ("png", "svg" or "html")
+    width : int | None, default=None
+        Image width in pixels (images only)
+    height : int | None, default=None
+        Image height in pixels (images only)
+
+    Returns
+    -------
+    bytes
+        Exported file content
+    """
+    import plotly.io as pio
+
+    fig = pio.from_json(fig_json)
+    if fmt == "html":
+        html: str = fig.to_html(include_plotlyjs="cdn")
+        return html.encode("utf-8")
+    image: bytes = fig.to_image(format=fmt, width=width, height=height)
+    return image
+
+
+def _sample_for_plot(df: pd.DataFrame) -> pd.DataFrame:
+    """Limit the number of rows sent to the browser for point charts.
+
+    Every row becomes part of the figure JSON, so large frames make line
+    and scatter charts bandwidth-bound. A fixed-seed sample keeps the
+    chart stable across reruns, and the sampled positions are sorted so
+    that line charts are drawn in the same row order as the full data,
+    whatever the index looks like.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data for charting
+
+    Returns
+    -------
+    pd.DataFrame
+        The data itself, or a sample of at most PLOT_LIMIT rows
+    """
+    if len(df) <= PLOT_LIMIT:
+        return df
+    rng = np.random.default_rng(0)
+    # インデックスではなく位置で選ぶ（並べ替え済み・文字列のインデックスでも順序を保つ）
+    return df.iloc[np.sort(rng.choice(len(df), PLOT_LIMIT, replace=False))]
+
+
+def _render_export(fig: Any, fmt: str, chart_name: str) -> None:
+    """Render the export button of one format and its download button.
+
+    The exported bytes are kept in the session state together with the
+    figure they were made from. The download button therefore stays
+    available on later reruns, including the one triggered by the
+    download itself, and the export is not rendered again until the
+    chart changes.
+
+    Parameters
+    ----------
+    fig : Any
+        Figure currently shown (shared by the cached chart factories)
+    fmt : str
+        Export format ("png", "svg" or "html")
+    chart_name : str
+        Chart name used in the download file name
+    """
+    button_label, download_label, mime, size = _EXPORT_SPECS[fmt]
+    state_key = f"_export_{fmt}"
+
+    if st.button(button_label):
+        st.session_state[state_key] = (fig, _export_bytes(fig.to_json(), fmt, **size))
+
+    # 表示中の図から作成したデータがあれば、ダウンロードボタンを表示し続ける
+    exported = st.session_state.get(state_key)
+    if exported is not None and exported[0] is fig:
+        st.download_button(
+            download_label, exported[1], f"chart_{chart_name}.{fmt}", mime
+        )
+
+
+@st.fragment
+def _render_chart_section(filtered_df: pd.DataFrame, meta: dict[str, Any]) -> None:
+    """Render the chart controls, chart and export options as a fragment.
+
+    Changing a chart setting reruns only this section; the data loading
+    and filtering above it are not re-executed.
+
+    Parameters
+    ----------
+    filtered_df : pd.DataFrame
+        Data for charting
+    meta : dict[str, Any]
+        Column metadata from _filter_meta
+    """
+    # チャート設定
+    chart_config = render_chart_controls(meta)
+
+    st.divider()
+
+    # チャート生成
+    st.subheader("📊 Generated Chart")
+
+    chart_type = chart_config["chart_type"]
+    # 棒グラフは行の値を積み上げるため、間引かずに全行を使う
+    plot_df = (
+        _sample_for_plot(filtered_df)
+        if chart_type in _SAMPLED_CHART_TYPES
+        else filtered_df
+    )
+
+    try:
+        options: dict[str, Any] = {
+            "x_col": chart_config["x_col"],
+            "y_col": chart_config["y_col"],
+            "title": chart_config["title"],
+            "color_col": chart_config["color_col"],
+            "height": chart_config["height"],
+        }
+        # サイズ指定は散布図でのみ選択される
+        if chart_config["size_col"]:
+            options["size_col"] = chart_config["size_col"]
+
+        # 各ファクトリは引数ごとに図をキャッシュするため、同じ設定なら再構築しない
+        fig = _CHART_BUILDERS[chart_type](plot_df, **options)
+
+        # チャートを表示
+        st.plotly_chart(fig, use_container_width=True)
+        if len(plot_df) != len(filtered_df):
+            st.caption(f"Showing {len(plot_df):,} of {len(filtered_df):,} points")
+
+        # チャート情報
+        with st.expander("📋 Chart Information"):
+            st.markdown(f"**Chart Type:** {chart_type}")
+            st.markdown(f"**Data Points:** {len(filtered_df):,}")
+            st.markdown(f"**X-axis:** {chart_config['x_col']}")
+            st.markdown(f"**Y-axis:** {chart_config['y_col']}")
+            if chart_config["color_col"]:
+                st.markdown(f"**Color:** {chart_config['color_col']}")
+            if chart_config.get("size_col"):
+                st.markdown(f"**Size:** {chart_config['size_col']}")
+
+        # エクスポートオプション
+        st.divider()
+        st.subheader("💾 Export Chart")
+
+        chart_name = chart_type.lower().replace(" ", "_")
+        for col, fmt in zip(st.columns(len(_EXPORT_SPECS)), _EXPORT_SPECS, strict=True):
+            with col:
+                _render_export(fig, fmt, chart_name)
+
+    except Exception as e:
+        logger.error("Failed to create chart", error=str(e), exc_info=True)
+        st.error(f"❌ Failed to create chart: {e}")
+
+        # エラー詳細
+        with st.expander("🔍 Error Details"):
+            st.code(str(e))
+            st.markdown("**Suggestions:**")
+            st.markdown("- Check if selected columns contain appropriate data types")
+            st.markdown("- Ensure Y-axis column contains numeric data")
+            st.markdown("- Try different column combinations")
+
+
+def render_visualization_page(config: AppConfig, sidebar_state: dict[str, Any]) -> None:
     """Render the visualization page.
 
     Parameters
@@ -213,29 +602,35 @@ def render_visualization_page(  # noqa: PLR0912, PLR0915
 
     if data_source == "Upload Your Data":
         if sidebar_state["uploaded_file"] is not None:
-            df = load_uploaded_data(sidebar_state["uploaded_file"])
+            df = _get_df(sidebar_state["uploaded_file"])
         else:
             st.info("👆 Please upload a file using the sidebar.")
 
     else:  # Sample Data
-        col1, col2 = st.columns([1, 4])
+        col1, _ = st.columns([1, 4])
         with col1:
             if st.button("🎲 Load Sample Data", type="primary"):
                 with st.spinner("Loading sample data..."):
-                    df = load_sample_data()
-                    st.session_state.sample_data = df
+                    load_sample_data()
+                    st.session_state[_SAMPLE_LOADED_KEY] = True
                     st.success("✅ Sample data loaded!")
 
-        # セッション状態からサンプルデータを取得
-        if "sample_data" in st.session_state:
-            df = st.session_state.sample_data
+        # サンプルデータは全セッションで共有されるため、読み込み済みかだけを保持する
+        if st.session_state.get(_SAMPLE_LOADED_KEY):
+            df = load_sample_data()
 
     # データが利用可能な場合の可視化
     if df is not None:
         st.divider()
 
+        # 値が変わらない範囲で各列を小さい型にする
+        df = _compact_dtypes(df)
+
+        # 列の情報はデータごとに1回だけ求め、フィルタとチャート設定で共有する
+        meta = _filter_meta(df)
+
         # データフィルタリング
-        filtered_df = render_data_filtering(df)
+        filtered_df = render_data_filtering(df, meta)
 
         if len(filtered_df) == 0:
             st.error("❌ No data remains after filtering. Please adjust your filters.")
@@ -243,121 +638,8 @@ def render_visualization_page(  # noqa: PLR0912, PLR0915
 
         st.divider()
 
-        # チャート設定
-        chart_config = render_chart_controls(filtered_df)
-
-        st.divider()
-
-        # チャート生成
-        st.subheader("📊 Generated Chart")
-
-        try:
-            if chart_config["chart_type"] == "Bar Chart":
-                fig = create_bar_chart(
-                    filtered_df,
-                    x_col=chart_config["x_col"],
-                    y_col=chart_config["y_col"],
-                    title=chart_config["title"],
-                    color_col=chart_config["color_col"],
-                    height=chart_config["height"],
-                )
-
-            elif chart_config["chart_type"] == "Line Chart":
-                fig = create_line_chart(
-                    filtered_df,
-                    x_col=chart_config["x_col"],
-                    y_col=chart_config["y_col"],
-                    title=chart_config["title"],
-                    color_col=chart_config["color_col"],
-                    height=chart_config["height"],
-                )
-
-            else:  # Scatter Plot
-                fig = create_scatter_plot(
-                    filtered_df,
-                    x_col=chart_config["x_col"],
-                    y_col=chart_config["y_col"],
-                    title=chart_config["title"],
-                    color_col=chart_config["color_col"],
-                    size_col=chart_config["size_col"],
-                    height=chart_config["height"],
-                )
-
-            # チャートを表示
-            st.plotly_chart(fig, use_container_width=True)
-
-            # チャート情報
-            with st.expander("📋 Chart Information"):
-                st.markdown(f"**Chart Type:** {chart_config['chart_type']}")
-                st.markdown(f"**Data Points:** {len(filtered_df):,}")
-                st.markdown(f"**X-axis:** {chart_config['x_col']}")
-                st.markdown(f"**Y-axis:** {chart_config['y_col']}")
-                if chart_config["color_col"]:
-                    st.markdown(f"**Color:** {chart_config['color_col']}")
-                if chart_config.get("size_col"):
-                    st.markdown(f"**Size:** {chart_config['size_col']}")
-
-            # エクスポートオプション
-            st.divider()
-            st.subheader("💾 Export Chart")
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                if st.button("📷 Export PNG"):
-                    img_bytes = fig.to_image(format="png", width=1200, height=800)
-                    st.download_button(
-                        "Download PNG",
-                        img_bytes,
-                        (
-                            "chart_"
-                            + chart_config["chart_type"].lower().replace(" ", "_")
-                            + ".png"
-                        ),
-                        "image/png",
-                    )
-
-            with col2:
-                if st.button("🖼️ Export SVG"):
-                    svg_bytes = fig.to_image(format="svg")
-                    st.download_button(
-                        "Download SVG",
-                        svg_bytes,
-                        (
-                            "chart_"
-                            + chart_config["chart_type"].lower().replace(" ", "_")
-                            + ".svg"
-                        ),
-                        "image/svg+xml",
-                    )
-
-            with col3:
-                if st.button("📄 Export HTML"):
-                    html_str = fig.to_html(include_plotlyjs="cdn")
-                    st.download_button(
-                        "Download HTML",
-                        html_str,
-                        (
-                            "chart_"
-                            + chart_config["chart_type"].lower().replace(" ", "_")
-                            + ".html"
-                        ),
-                        "text/html",
-                    )
-
-        except Exception as e:
-            logger.error("Failed to create chart", error=str(e), exc_info=True)
-            st.error(f"❌ Failed to create chart: {e}")
-
-            # エラー詳細
-            with st.expander("🔍 Error Details"):
-                st.code(str(e))
-                st.markdown("**Suggestions:**")
-                st.markdown(
-                    "- Check if selected columns contain appropriate data types"
-                )
-                st.markdown("- Ensure Y-axis column contains numeric data")
-                st.markdown("- Try different column combinations")
+        # チャート設定・生成・エクスポート（操作時はこの部分だけ再実行される）
+        _render_chart_section(filtered_df, meta)
 
     else:
         # データがない場合のヘルプ
@@ -1,11 +1,20 @@
 """Helper functions for common operations."""
 
 import json
+import math
 from pathlib import Path
 from typing import Any
 
 from .logging_config import get_logger
 
+try:
+    # orjsonは任意依存（fast extra）。無い場合は標準ライブラリのjsonを使う
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
@@ -120,6 +129,100 @@ def save_json_file(data: Any, file_path: str | Path, indent: int | None = 2) ->
         raise ValueError(f"Data is not JSON serializable: {e}") from e
 
 
+def _finite_or_none(obj: Any) -> Any:
+    """Replace NaN and infinity with None, as orjson writes them as null."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays for the stdlib JSON encoder."""
+    if hasattr(obj, "tolist"):
+        return _finite_or_none(obj.tolist())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json_bytes(data: Any, *, pretty: bool = True) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise. Both paths accept numpy values and non-string keys,
+    and write NaN and infinity as ``null``.
+
+    Parameters
+    ----------
+    data : Any
+        Data to serialize
+    pretty : bool, default=True
+        Indent the output by two spaces
+
+    Returns
+    -------
+    bytes
+        Encoded JSON document
+
+    Raises
+    ------
+    ValueError
+        If data is not JSON serializable
+    """
+    try:
+        if _HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            payload: bytes = orjson.dumps(data, option=option)
+            return payload
+
+        return json.dumps(
+            _finite_or_none(data),
+            indent=2 if pretty else None,
+            ensure_ascii=False,
+            allow_nan=False,
+            default=_json_default,
+        ).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Data is not JSON serializable: {e}") from e
+
+
+def _reject_constant(name: str) -> Any:
+    """Reject the non-standard NaN and Infinity tokens when parsing."""
+    raise ValueError(f"Unsupported JSON constant: {name}")
+
+
+def load_json_bytes(data: bytes | str) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Parameters
+    ----------
+    data : bytes | str
+        Encoded JSON document
+
+    Returns
+    -------
+    Any
+        Parsed data
+
+    Raises
+    ------
+    ValueError
+        If data is not valid JSON, including NaN and Infinity tokens
+    """
+    try:
+        if _HAS_ORJSON:
+            return orjson.loads(data)
+        # orjsonと同様にNaN・Infinityは不正なJSONとして扱う
+        return json.loads(data, parse_constant=_reject_constant)
+    except ValueError as e:
+        # orjson.JSONDecodeErrorとjson.JSONDecodeErrorはどちらもValueErrorの派生
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+
 def load_json_file(file_path: str | Path) -> Any:
     """Load data from a JSON file.
 
@@ -0,0 +1,84 @@
+"""Shared fixtures for Streamlit tests."""
+
+from typing import Any
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import pytest
+
+from python_coding_test.streamlit.components.charts import (
+    create_bar_chart,
+    create_line_chart,
+    create_scatter_plot,
+    load_sample_data,
+)
+from python_coding_test.streamlit.pages.data_analysis import compute_quality_stats
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_plotly() -> None:
+    """Pay Plotly's first-figure setup once before any timed test runs."""
+    # 初回のバリデータ生成とテンプレート読み込みを済ませておく
+    go.Figure()
+    px.scatter(x=[0], y=[0])
+
+
+@pytest.fixture(scope="session")
+def sample_df() -> pd.DataFrame:
+    """Create sample DataFrame for testing (shared; do not mutate)."""
+    return pd.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5],
+            "y": [10, 20, 15, 25, 30],
+            "category": ["A", "B", "A", "B", "A"],
+            "size": [5, 10, 7, 12, 8],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_df() -> pd.DataFrame:
+    """Create empty DataFrame for testing (shared; do not mutate)."""
+    return pd.DataFrame()
+
+
+@pytest.fixture(scope="session")
+def sample_data() -> pd.DataFrame:
+    """Load the app's sample dataset once per session (shared; do not mutate)."""
+    return load_sample_data()
+
+
+@pytest.fixture(scope="session")
+def sample_data_memory_bytes(sample_data: pd.DataFrame) -> int:
+    """Measure the shallow memory usage of the sample dataset once per session.
+
+    Like the app's data overview, object columns are counted by pointer
+    size only; the size limits checked with it are orders of magnitude
+    larger than the sample data.
+    """
+    return int(sample_data.memory_usage(deep=False).sum())
+
+
+@pytest.fixture(scope="session")
+def sample_data_quality(sample_data: pd.DataFrame) -> dict[str, Any]:
+    """Compute the app's quality statistics of the sample dataset once per session."""
+    return compute_quality_stats(sample_data)
+
+
+@pytest.fixture(scope="class")
+def default_bar_fig(sample_df: pd.DataFrame) -> go.Figure:
+    """Create a bar chart of sample_df with default options (read-only)."""
+    return create_bar_chart(sample_df, x_col="x", y_col="y")
+
+
+@pytest.fixture(scope="class")
+def default_line_fig(sample_df: pd.DataFrame) -> go.Figure:
+    """Create a line chart of sample_df with default options (read-only)."""
+    return create_line_chart(sample_df, x_col="x", y_col="y")
+
+
+@pytest.fixture(scope="class")
+def default_scatter_fig(sample_df: pd.DataFrame) -> go.Figure:
+    """Create a scatter plot of sample_df with default options (read-only)."""
+    return create_scatter_plot(sample_df, x_col="x", y_col="y")
@@ -1,7 +1,7 @@
 """Tests for Streamlit chart components."""
 
-import numpy as np
 import pandas as pd
+import plotly.express as px
 import plotly.graph_objects as go
 import pytest
 
@@ -16,24 +16,29 @@ from python_coding_test.streamlit.components.charts import (
 class TestChartComponents:
     """Test chart creation functions."""
 
-    @pytest.fixture
-    def sample_df(self) -> pd.DataFrame:
-        """Create sample DataFrame for testing."""
-        return pd.DataFrame(
-            {
-                "x": [1, 2, 3, 4, 5],
-                "y": [10, 20, 15, 25, 30],
-                "category": ["A", "B", "A", "B", "A"],
-                "size": [5, 10, 7, 12, 8],
-            }
-        )
-
-    def test_正常系_棒グラフが作成される(self, sample_df: pd.DataFrame) -> None:
-        """棒グラフが正しく作成されることを確認。"""
-        fig = create_bar_chart(sample_df, x_col="x", y_col="y")
+    @pytest.mark.parametrize(
+        ("fig_fixture", "trace_type", "mode"),
+        [
+            ("default_bar_fig", "bar", None),
+            ("default_line_fig", "scatter", "lines+markers"),
+            ("default_scatter_fig", "scatter", "markers"),
+        ],
+        ids=["bar", "line", "scatter"],
+    )
+    def test_正常系_各種チャートが作成される(
+        self,
+        request: pytest.FixtureRequest,
+        fig_fixture: str,
+        trace_type: str,
+        mode: str | None,
+    ) -> None:
+        """棒グラフ・折れ線グラフ・散布図が正しく作成されることを確認。"""
+        fig = request.getfixturevalue(fig_fixture)
 
         assert isinstance(fig, go.Figure)
-        assert fig.data[0].type == "bar"
+        assert fig.data[0].type == trace_type
+        if mode is not None:
+            assert fig.data[0].mode == mode
         assert len(fig.data[0].x) == 5
         assert len(fig.data[0].y) == 5
 
@@ -52,26 +57,6 @@ class TestChartComponents:
         # 色分けがある場合、複数のトレースが作成される
         assert len(fig.data) >= 1
 
-    def test_正常系_折れ線グラフが作成される(self, sample_df: pd.DataFrame) -> None:
-        """折れ線グラフが正しく作成されることを確認。"""
-        fig = create_line_chart(sample_df, x_col="x", y_col="y")
-
-        assert isinstance(fig, go.Figure)
-        assert fig.data[0].type == "scatter"
-        assert fig.data[0].mode == "lines+markers"
-        assert len(fig.data[0].x) == 5
-        assert len(fig.data[0].y) == 5
-
-    def test_正常系_散布図が作成される(self, sample_df: pd.DataFrame) -> None:
-        """散布図が正しく作成されることを確認。"""
-        fig = create_scatter_plot(sample_df, x_col="x", y_col="y")
-
-        assert isinstance(fig, go.Figure)
-        assert fig.data[0].type == "scatter"
-        assert fig.data[0].mode == "markers"
-        assert len(fig.data[0].x) == 5
-        assert len(fig.data[0].y) == 5
-
     def test_正常系_散布図がサイズ指定で作成される(
         self, sample_df: pd.DataFrame
     ) -> None:
@@ -83,15 +68,29 @@ class TestChartComponents:
         assert isinstance(fig, go.Figure)
         assert fig.layout.height == 600
 
+    @pytest.mark.parametrize(
+        ("rows", "trace_type"),
+        [(1000, "scatter"), (1001, "scattergl")],
+        ids=["1000rows", "1001rows"],
+    )
+    def test_正常系_1000点を超えるとWebGLトレースが使われる(
+        self, rows: int, trace_type: str
+    ) -> None:
+        """Plotly Expressと同様、1000点を超える場合だけWebGLで描画されることを確認。"""
+        df = pd.DataFrame({"x": range(rows), "y": range(rows)})
+
+        assert create_scatter_plot(df, x_col="x", y_col="y").data[0].type == (
+            trace_type
+        )
+        assert create_line_chart(df, x_col="x", y_col="y").data[0].type == trace_type
+
     def test_異常系_存在しない列名でValueError(self, sample_df: pd.DataFrame) -> None:
         """存在しない列名を指定した場合、ValueErrorが発生することを確認。"""
         with pytest.raises(ValueError, match="Failed to create bar chart"):
             create_bar_chart(sample_df, x_col="nonexistent", y_col="y")
 
-    def test_異常系_空のDataFrameでValueError(self) -> None:
+    def test_異常系_空のDataFrameでValueError(self, empty_df: pd.DataFrame) -> None:
         """空のDataFrameを渡した場合、ValueErrorが発生することを確認。"""
-        empty_df = pd.DataFrame()
-
         with pytest.raises(ValueError, match="Failed to create line chart"):
             create_line_chart(empty_df, x_col="x", y_col="y")
 
@@ -108,13 +107,25 @@ class TestChartComponents:
         assert fig.layout.xaxis.title.text == "X"
         assert fig.layout.yaxis.title.text == "Y"
 
+    def test_正常系_棒グラフの重複xはPlotly_Expressと同じく積み上げられる(self) -> None:
+        """単一系列の棒グラフのbarmodeがPlotly Expressと一致することを確認。"""
+        df = pd.DataFrame({"x": ["a", "a", "b"], "y": [1, 2, 3]})
+
+        fig = create_bar_chart(df, x_col="x", y_col="y")
+        expected = px.bar(df, x="x", y="y", template="plotly_white")
+
+        assert fig.layout.barmode == "relative"
+        assert fig.layout.barmode == expected.layout.barmode
+
 
 class TestLoadSampleData:
     """Test sample data loading."""
 
-    def test_正常系_サンプルデータが読み込まれる(self) -> None:
+    def test_正常系_サンプルデータが読み込まれる(
+        self, sample_data: pd.DataFrame
+    ) -> None:
         """サンプルデータが正しく読み込まれることを確認。"""
-        df = load_sample_data()
+        df = sample_data
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 100
@@ -126,9 +137,9 @@ class TestLoadSampleData:
         assert "customer_count" in df.columns
         assert "satisfaction" in df.columns
 
-    def test_正常系_サンプルデータの型が正しい(self) -> None:
+    def test_正常系_サンプルデータの型が正しい(self, sample_data: pd.DataFrame) -> None:
         """サンプルデータの型が正しいことを確認。"""
-        df = load_sample_data()
+        df = sample_data
 
         assert pd.api.types.is_datetime64_any_dtype(df["date"])
         assert pd.api.types.is_integer_dtype(df["sales"])
@@ -138,9 +149,11 @@ class TestLoadSampleData:
         assert pd.api.types.is_integer_dtype(df["customer_count"])
         assert pd.api.types.is_float_dtype(df["satisfaction"])
 
-    def test_正常系_サンプルデータの値範囲が妥当(self) -> None:
+    def test_正常系_サンプルデータの値範囲が妥当(
+        self, sample_data: pd.DataFrame
+    ) -> None:
         """サンプルデータの値範囲が妥当であることを確認。"""
-        df = load_sample_data()
+        df = sample_data
 
         # 売上は正の値
         assert (df["sales"] > 0).all()
@@ -150,12 +163,15 @@ class TestLoadSampleData:
         assert (df["satisfaction"] <= 5).all()
 
         # カテゴリの種類
-        assert set(df["category"].unique()) == {"A", "B", "C"}
-        assert set(df["region"].unique()) == {"North", "South", "East", "West"}
+        assert sorted(df["category"].unique()) == ["A", "B", "C"]
+        assert sorted(df["region"].unique()) == ["East", "North", "South", "West"]
 
     def test_正常系_再現性がある(self) -> None:
         """同じシードで同じデータが生成されることを確認。"""
         df1 = load_sample_data()
+        # キャッシュされた同じオブジェクトではなく、再生成したデータと比較する
+        load_sample_data.clear()
         df2 = load_sample_data()
 
+        assert df1 is not df2
         pd.testing.assert_frame_equal(df1, df2)
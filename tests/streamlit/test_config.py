@@ -1,7 +1,5 @@
 """Tests for Streamlit app configuration."""
 
-import pytest
-
 from python_coding_test.streamlit.config import AppConfig
 
 
@@ -1,11 +1,21 @@
 """Tests for data analysis page functionality."""
 
 import io
+import json
+import sys
 
 import pandas as pd
 import pytest
 
-from python_coding_test.streamlit.pages.data_analysis import load_uploaded_data
+from python_coding_test.streamlit.pages.data_analysis import (
+    _describe_numeric,
+    _most_frequent,
+    _to_csv_bytes,
+    _to_json_bytes,
+    compute_quality_stats,
+    load_uploaded_data,
+)
+from python_coding_test.utils.helpers import dump_json_bytes
 
 
 class MockUploadedFile:
@@ -20,9 +30,16 @@ class MockUploadedFile:
         """Read file content as bytes."""
         return self.content.encode("utf-8")
 
-    def getvalue(self) -> str:
-        """Get file content as string."""
-        return self.content
+    def getvalue(self) -> bytes:
+        """Get file content as bytes."""
+        return self.content.encode("utf-8")
+
+
+def _load(content: str, filename: str = "data.csv") -> pd.DataFrame:
+    """Load content through the app's pyarrow-backed upload reader."""
+    df = load_uploaded_data(MockUploadedFile(content, filename))
+    assert df is not None
+    return df
 
 
 class TestLoadUploadedData:
@@ -32,13 +49,12 @@ class TestLoadUploadedData:
         """CSVファイルが正しく読み込まれることを確認。"""
         csv_content = "id,name,value\n1,Alice,100\n2,Bob,200\n3,Charlie,300"
 
-        # StringIOオブジェクトを直接作成してテスト
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 3
         assert list(df.columns) == ["id", "name", "value"]
-        assert df.iloc[0]["name"] == "Alice"
+        assert df["name"].iat[0] == "Alice"
 
     def test_正常系_JSONファイルが読み込まれる(self) -> None:
         """JSONファイルが正しく読み込まれることを確認。"""
@@ -47,19 +63,18 @@ class TestLoadUploadedData:
             '{"id": 2, "name": "Bob", "value": 200}]'
         )
 
-        # StringIOオブジェクトを直接作成してテスト
-        df = pd.read_json(io.StringIO(json_content))
+        df = _load(json_content, "data.json")
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 2
         assert list(df.columns) == ["id", "name", "value"]
-        assert df.iloc[0]["name"] == "Alice"
+        assert df["name"].iat[0] == "Alice"
 
     def test_正常系_空のCSVファイルが処理される(self) -> None:
         """空のCSVファイルが適切に処理されることを確認。"""
         csv_content = "id,name,value"  # ヘッダーのみ
 
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
@@ -69,7 +84,7 @@ class TestLoadUploadedData:
         """数値データが適切な型で読み込まれることを確認。"""
         csv_content = "id,score,temperature\n1,85.5,23.4\n2,92.1,24.7"
 
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert pd.api.types.is_integer_dtype(df["id"])
         assert pd.api.types.is_float_dtype(df["score"])
@@ -79,10 +94,8 @@ class TestLoadUploadedData:
         """日付データが読み込まれることを確認。"""
         csv_content = "date,value\n2024-01-01,100\n2024-01-02,200"
 
-        df = pd.read_csv(io.StringIO(csv_content))
-
-        # 日付変換
-        df["date"] = pd.to_datetime(df["date"])
+        # pyarrowのCSVリーダーが日付列を変換する
+        df = _load(csv_content)
 
         assert pd.api.types.is_datetime64_any_dtype(df["date"])
         assert len(df) == 2
@@ -93,21 +106,21 @@ class TestLoadUploadedData:
             'id,name,description\n1,"Alice","Hello, World!"\n2,"Bob","Line1\nLine2"'
         )
 
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert len(df) == 2
-        assert df.iloc[0]["description"] == "Hello, World!"
-        assert "Line1\nLine2" in df.iloc[1]["description"]
+        assert df["description"].iat[0] == "Hello, World!"
+        assert "Line1\nLine2" in df["description"].iat[1]
 
     def test_正常系_欠損値が適切に処理される(self) -> None:
         """欠損値が適切に処理されることを確認。"""
         csv_content = "id,name,value\n1,Alice,100\n2,,200\n3,Charlie,"
 
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert len(df) == 3
-        assert pd.isna(df.iloc[1]["name"])
-        assert pd.isna(df.iloc[2]["value"])
+        assert pd.isna(df["name"].iat[1])
+        assert pd.isna(df["value"].iat[2])
 
     def test_正常系_大きなファイルが処理される(self) -> None:
         """大きなファイルが処理されることを確認（パフォーマンステスト）。"""
@@ -117,11 +130,111 @@ class TestLoadUploadedData:
             rows.append(f"{i},{i * 10}")
         csv_content = "\n".join(rows)
 
-        df = pd.read_csv(io.StringIO(csv_content))
+        df = _load(csv_content)
 
         assert len(df) == 1000
-        assert df.iloc[-1]["id"] == 999
-        assert df.iloc[-1]["value"] == 9990
+        assert df["id"].iat[-1] == 999
+        assert df["value"].iat[-1] == 9990
+
+
+class TestLoadUploadedDataReader:
+    """Test load_uploaded_data with the pyarrow-backed readers."""
+
+    def test_正常系_CSVがpyarrowで読み込まれる(self) -> None:
+        """CSVがpandas互換のdtypeで読み込まれることを確認。"""
+        uploaded = MockUploadedFile(
+            "id,name,value\n1,Alice,100\n2,,200\n3,Charlie,", "data.csv"
+        )
+
+        df = load_uploaded_data(uploaded)
+
+        assert df is not None
+        assert list(df.columns) == ["id", "name", "value"]
+        assert pd.api.types.is_integer_dtype(df["id"])
+        assert pd.api.types.is_object_dtype(df["name"])
+        assert pd.isna(df["name"].iat[1])
+        assert pd.isna(df["value"].iat[2])
+
+    def test_正常系_JSON配列がフォールバックで読み込まれる(self) -> None:
+        """pyarrowが扱えないJSON配列がpandasで読み込まれることを確認。"""
+        uploaded = MockUploadedFile(
+            '[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]', "data.json"
+        )
+
+        df = load_uploaded_data(uploaded)
+
+        assert df is not None
+        assert len(df) == 2
+        assert df["name"].iat[1] == "Bob"
+
+    @pytest.mark.parametrize("orient", ["columns", "index", "records"])
+    def test_正常系_JSONの向きに関わらずpandasと同じ結果になる(
+        self, orient: str
+    ) -> None:
+        """列・行・レコード形式のJSONがpd.read_jsonと同じ結果になることを確認。"""
+        source = pd.DataFrame({"id": [1, 2, 3], "name": ["Alice", "Bob", "Carol"]})
+        content = source.to_json(orient=orient)
+
+        df = _load(content, f"{orient}.json")
+
+        expected = pd.read_json(io.StringIO(content))
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_正常系_JSON_Linesがレコードごとに読み込まれる(self) -> None:
+        """1行1レコードのJSONが行ごとに読み込まれることを確認。"""
+        content = '{"id": 1, "name": "Alice"}\n{"id": 2, "name": "Bob"}\n'
+
+        df = _load(content, "data.json")
+
+        pd.testing.assert_frame_equal(
+            df, pd.read_json(io.StringIO(content), lines=True)
+        )
+
+    def test_正常系_キャッシュ結果の変更が次回読み込みに影響しない(self) -> None:
+        """キャッシュされた結果を変更しても、再読み込みに影響しないことを確認。"""
+        content = "id,value\n1,10\n2,20"
+
+        first = load_uploaded_data(MockUploadedFile(content, "cached.csv"))
+        assert first is not None
+        first["value"] = 0
+
+        second = load_uploaded_data(MockUploadedFile(content, "cached.csv"))
+        assert second is not None
+        assert second["value"].tolist() == [10, 20]
+
+    def test_正常系_アップロードごとに別の内容が読み込まれる(self) -> None:
+        """file_idが異なるアップロードは、同名でもそれぞれの内容で読み込まれることを確認。"""
+        first_file = MockUploadedFile("id\n1", "same.csv")
+        first_file.file_id = "upload-1"
+        second_file = MockUploadedFile("id\n2", "same.csv")
+        second_file.file_id = "upload-2"
+
+        first = load_uploaded_data(first_file)
+        second = load_uploaded_data(second_file)
+
+        assert first is not None
+        assert second is not None
+        assert first["id"].tolist() == [1]
+        assert second["id"].tolist() == [2]
+
+    def test_正常系_重複と空の列名がpandasと同じ名前になる(self) -> None:
+        """重複・空の列名がpandasと同様に改名され、品質統計も計算できることを確認。"""
+        content = "a,a,\n1,2,x\n3,4,y"
+
+        df = _load(content)
+
+        expected = pd.read_csv(io.StringIO(content))
+        assert list(df.columns) == ["a", "a.1", "Unnamed: 2"]
+        pd.testing.assert_frame_equal(df, expected)
+        stats = compute_quality_stats(df)
+        assert stats["null_total"] == 0
+        assert list(stats["describe"].columns) == ["a", "a.1"]
+
+    def test_異常系_未対応の拡張子でNoneを返す(self) -> None:
+        """未対応の拡張子の場合、Noneが返されることを確認。"""
+        uploaded = MockUploadedFile("a,b\n1,2", "data.txt")
+
+        assert load_uploaded_data(uploaded) is None
 
 
 class TestDataValidation:
@@ -137,15 +250,13 @@ class TestDataValidation:
             }
         )
 
-        # 数値のような文字列を検出
-        numeric_like_cols = []
-        for col in df.columns:
-            if df[col].dtype == "object":
-                try:
-                    pd.to_numeric(df[col], errors="raise")
-                    numeric_like_cols.append(col)
-                except (ValueError, TypeError):
-                    pass
+        # 数値のような文字列を検出（変換で新たに欠損が生じない列）
+        numeric_like_cols = [
+            col
+            for col in df.columns
+            if df[col].dtype == "object"
+            and pd.to_numeric(df[col], errors="coerce").notna().equals(df[col].notna())
+        ]
 
         assert "numeric_string" in numeric_like_cols
         assert "text" not in numeric_like_cols
@@ -187,3 +298,209 @@ class TestDataValidation:
         assert missing_percentages["complete"] == 0.0
         assert missing_percentages["partial"] == 50.0
         assert missing_percentages["empty"] == 100.0
+
+
+class TestComputeQualityStats:
+    """Test shared per-frame statistics."""
+
+    def test_正常系_統計値がまとめて計算される(self) -> None:
+        """欠損値・重複・ユニーク数・数値サマリーが計算されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 2, 3],
+                "name": ["Alice", "Bob", "Bob", None],
+            }
+        )
+
+        stats = compute_quality_stats(df)
+
+        assert stats["null_per_col"]["name"] == 1
+        assert stats["null_total"] == 1
+        assert stats["dupes"] == 1
+        assert stats["nunique"]["name"] == 2
+        assert list(stats["describe"].columns) == ["id"]
+        assert stats["overview"]["total_rows"] == len(df)
+        assert stats["overview"]["total_columns"] == len(df.columns)
+        assert stats["overview"]["missing_values"] == 1
+        assert stats["overview"]["memory_usage_kb"] > 0
+        assert stats["column_info"]["Non-Null Count"].tolist() == [4, 3]
+
+    def test_正常系_一意な列があれば重複行は0件(self) -> None:
+        """全行で値が異なる列がある場合、重複行が0件になることを確認。"""
+        df = pd.DataFrame({"id": [1, 2, 3], "name": ["Bob", "Bob", "Bob"]})
+
+        stats = compute_quality_stats(df)
+
+        assert stats["dupes"] == 0
+        assert stats["dupes"] == df.duplicated().sum()
+
+    def test_正常系_数値サマリーがpandasのdescribeと一致する(self) -> None:
+        """高速化した数値サマリーがpandasのdescribe()と同じ結果になることを確認。"""
+        df = pd.DataFrame(
+            {
+                "int_col": [1, 2, 2, 3, 10],
+                "float_col": [1.5, None, 2.0, 3.25, 4.0],
+                0: [5, 4, 3, 2, 1],
+                "text": ["a", "b", "c", "d", "e"],
+            }
+        )
+
+        stats = compute_quality_stats(df)
+
+        pd.testing.assert_frame_equal(
+            stats["describe"], df.select_dtypes(include=["number"]).describe()
+        )
+
+    def test_正常系_polarsとpandasの数値サマリーが一致する(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """USE_POLARSの有無で数値サマリーが同じになることを確認。"""
+        pytest.importorskip("polars")
+        numeric = pd.DataFrame(
+            {"int_col": [1, 2, 2, 3, 10], "float_col": [1.5, None, 2.0, 3.25, 4.0]}
+        )
+
+        monkeypatch.setenv("USE_POLARS", "1")
+        with_polars = _describe_numeric(numeric)
+        monkeypatch.delenv("USE_POLARS")
+        with_pandas = _describe_numeric(numeric)
+
+        pd.testing.assert_frame_equal(with_polars, with_pandas)
+        pd.testing.assert_frame_equal(with_pandas, numeric.describe())
+
+    def test_正常系_polarsが無い場合はpandasで計算される(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """USE_POLARSを指定してもpolarsが無ければpandasで計算されることを確認。"""
+        numeric = pd.DataFrame({"value": [1.0, 2.0, 4.0]})
+        monkeypatch.setenv("USE_POLARS", "true")
+        monkeypatch.setitem(sys.modules, "polars", None)
+
+        pd.testing.assert_frame_equal(_describe_numeric(numeric), numeric.describe())
+
+    def test_正常系_数値のような文字列列が検出される(self) -> None:
+        """数値のような文字列を含むobject列だけが検出されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "numeric_string": ["1", "2", None],
+                "text": ["apple", "banana", "cherry"],
+                "mixed": ["1", "text", "3"],
+                "empty": [None, None, None],
+            },
+            dtype="object",
+        )
+
+        stats = compute_quality_stats(df)
+
+        assert stats["numeric_text_cols"] == ["numeric_string"]
+
+    def test_正常系_空白や数値オブジェクトを含む列も数値として検出される(self) -> None:
+        """前後の空白付き文字列や数値オブジェクトが混在する列も検出されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "padded": [" 1", "2.5 ", "-3"],
+                "mixed_objects": [1, "2", 3.5],
+                "mixed_text": [1, "text", 3],
+            },
+            dtype="object",
+        )
+
+        stats = compute_quality_stats(df)
+
+        assert stats["numeric_text_cols"] == ["padded", "mixed_objects"]
+
+
+class TestMostFrequent:
+    """Test the most frequent value of the categorical summary."""
+
+    def test_正常系_同数の最頻値はmodeと同じ値になる(self) -> None:
+        """出現回数が同じ値がある場合、Series.mode()と同じ値が選ばれることを確認。"""
+        series = pd.Series(["b", "a", "b", "a", "c"])
+
+        assert _most_frequent(series.value_counts()) == series.mode().iloc[0] == "a"
+
+    def test_正常系_カテゴリ型の同数の最頻値はカテゴリ順で選ばれる(self) -> None:
+        """カテゴリ型ではmode()と同じくカテゴリの順序で選ばれることを確認。"""
+        series = pd.Series(pd.Categorical(["a", "z", "a", "z"], categories=["z", "a"]))
+
+        assert _most_frequent(series.value_counts()) == series.mode().iloc[0] == "z"
+
+
+class TestCsvExport:
+    """Test CSV export encoding."""
+
+    def test_正常系_CSVバイト列が元のデータに戻る(self) -> None:
+        """エクスポートしたCSVを読み戻すと同じデータになることを確認。"""
+        df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob, Jr."]})
+
+        restored = pd.read_csv(io.BytesIO(_to_csv_bytes(df)))
+
+        pd.testing.assert_frame_equal(restored, df)
+
+    def test_正常系_混在型の列が文字列として書き出される(self) -> None:
+        """数値と文字列が混在する列が各値の文字列表現で書き出されることを確認。"""
+        df = pd.DataFrame({"mixed": [1, "text", 3.5]})
+
+        content = _to_csv_bytes(df).decode("utf-8")
+
+        assert content.splitlines() == ["mixed", "1", "text", "3.5"]
+
+    def test_正常系_日時_真偽値_小数の書式がpandasと一致する(self) -> None:
+        """日時・真偽値・小数の列がdf.to_csvと同じバイト列で書き出されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2024-01-01 00:00:00", "2024-01-02 12:30:00"]),
+                "flag": [True, False],
+                "value": [5.0, 1.25],
+                "text": ["plain", 'say "hi"'],
+            }
+        )
+
+        content = _to_csv_bytes(df)
+
+        assert content == df.to_csv(index=False).encode("utf-8")
+        assert content.decode("utf-8").splitlines()[1] == (
+            "2024-01-01 00:00:00,True,5.0,plain"
+        )
+
+
+class TestJsonExport:
+    """Test JSON data export encoding."""
+
+    def test_正常系_JSON配列として書き出される(self) -> None:
+        """レコードのJSON配列として書き出されることを確認。"""
+        df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
+
+        records = json.loads(_to_json_bytes(df))
+
+        assert records == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+    def test_正常系_エクスポートしたJSONを再アップロードできる(self) -> None:
+        """エクスポートしたJSONがアップロード処理で同じデータに戻ることを確認。"""
+        df = pd.DataFrame({"id": [1, 2, 3], "value": [1.5, 2.0, 3.25]})
+
+        restored = _load(_to_json_bytes(df).decode("utf-8"), "analyzed_data.json")
+
+        pd.testing.assert_frame_equal(restored, df)
+
+
+class TestSummaryExport:
+    """Test JSON summary export encoding."""
+
+    def test_正常系_統計値の要約がJSONバイト列になる(self) -> None:
+        """numpy値や数値キーを含む要約がJSONとして読み戻せることを確認。"""
+        df = pd.DataFrame({"id": [1, 2, 3], 0: [1.5, None, 2.5]})
+        stats = compute_quality_stats(df)
+        summary = {
+            "overview": stats["overview"],
+            "missing_values": stats["null_per_col"].to_dict(),
+            "numeric_summary": stats["describe"].to_dict(),
+            "nunique": stats["nunique"].to_numpy(),
+        }
+
+        restored = json.loads(dump_json_bytes(summary))
+
+        assert restored["overview"]["total_rows"] == 3
+        assert restored["missing_values"] == {"id": 0, "0": 1}
+        assert restored["numeric_summary"]["id"]["mean"] == 2.0
+        assert restored["nunique"] == [3, 2]
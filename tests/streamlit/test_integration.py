@@ -1,19 +1,32 @@
 """Integration tests for Streamlit application."""
 
+import io
+import json
+import time
+from typing import Any
+
 import pandas as pd
 import pytest
 
-from python_coding_test.streamlit.components.charts import load_sample_data
+from python_coding_test.streamlit.components.charts import (
+    create_bar_chart,
+    create_line_chart,
+    create_scatter_plot,
+    load_sample_data,
+)
 from python_coding_test.streamlit.config import AppConfig
+from python_coding_test.streamlit.pages.data_analysis import _to_json_bytes
 
 
 class TestStreamlitIntegration:
     """Integration tests for Streamlit components."""
 
-    def test_正常系_設定とサンプルデータの統合(self) -> None:
+    def test_正常系_設定とサンプルデータの統合(
+        self, sample_data: pd.DataFrame, sample_data_memory_bytes: int
+    ) -> None:
         """AppConfigとサンプルデータが正しく連携することを確認。"""
         config = AppConfig()
-        df = load_sample_data()
+        df = sample_data
 
         # 設定で許可されたファイル形式を確認
         assert "csv" in config.allowed_file_formats
@@ -25,18 +38,25 @@ class TestStreamlitIntegration:
         assert not df.empty
 
         # アップロードサイズ制限との整合性
-        estimated_size_kb = df.memory_usage(deep=True).sum() / 1024
+        estimated_size_kb = sample_data_memory_bytes / 1024
         assert estimated_size_kb < config.max_upload_size_mb * 1024
 
-    def test_正常系_チャート作成とデータ処理の統合(self) -> None:
-        """チャート作成とデータ処理が正しく統合されることを確認。"""
-        from python_coding_test.streamlit.components.charts import (
-            create_bar_chart,
-            create_line_chart,
-            create_scatter_plot,
-        )
+    def test_正常系_正確な深いメモリ測定(
+        self, sample_data: pd.DataFrame, sample_data_memory_bytes: int
+    ) -> None:
+        """文字列の実体を含むメモリ使用量も、アップロード上限に収まることを確認。"""
+        config = AppConfig()
+        deep_bytes = int(sample_data.memory_usage(deep=True).sum())
 
-        df = load_sample_data()
+        # 文字列列の実体を含むため、ポインタ分のみの見積もり以上になる
+        assert deep_bytes > sample_data_memory_bytes
+        assert deep_bytes < config.max_upload_size_mb * 1024 * 1024
+
+    def test_正常系_チャート作成とデータ処理の統合(
+        self, sample_data: pd.DataFrame
+    ) -> None:
+        """チャート作成とデータ処理が正しく統合されることを確認。"""
+        df = sample_data
 
         # 数値列の取得
         numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
@@ -61,11 +81,11 @@ class TestStreamlitIntegration:
         assert scatter_fig is not None
         assert len(scatter_fig.data) > 0
 
-    def test_正常系_データフィルタリングとチャート作成(self) -> None:
+    def test_正常系_データフィルタリングとチャート作成(
+        self, sample_data: pd.DataFrame
+    ) -> None:
         """データフィルタリングとチャート作成の統合テスト。"""
-        from python_coding_test.streamlit.components.charts import create_bar_chart
-
-        df = load_sample_data()
+        df = sample_data
 
         # カテゴリ別フィルタリング
         category_a_data = df[df["category"] == "A"]
@@ -80,19 +100,21 @@ class TestStreamlitIntegration:
         assert fig.layout.title.text == "Category A Sales"
         assert len(fig.data[0].x) == len(category_a_data)
 
-    def test_正常系_統計計算とデータ品質チェック(self) -> None:
+    def test_正常系_統計計算とデータ品質チェック(
+        self, sample_data: pd.DataFrame, sample_data_quality: dict[str, Any]
+    ) -> None:
         """統計計算とデータ品質チェックの統合テスト。"""
-        df = load_sample_data()
+        df = sample_data
 
         # 基本統計
-        numeric_summary = df.describe()
+        numeric_summary = sample_data_quality["describe"]
         assert not numeric_summary.empty
         assert "sales" in numeric_summary.columns
         assert "profit" in numeric_summary.columns
 
         # データ品質チェック
-        missing_values = df.isnull().sum()
-        duplicates = df.duplicated().sum()
+        missing_values = sample_data_quality["null_per_col"]
+        duplicates = sample_data_quality["dupes"]
 
         # サンプルデータは完全であることを確認
         assert missing_values.sum() == 0
@@ -116,12 +138,14 @@ class TestStreamlitIntegration:
             elif expected_type == "object":
                 assert pd.api.types.is_object_dtype(df[col])
 
-    def test_正常系_エクスポート機能の統合(self) -> None:
+    def test_正常系_エクスポート機能の統合(
+        self,
+        sample_data: pd.DataFrame,
+        sample_data_memory_bytes: int,
+        sample_data_quality: dict[str, Any],
+    ) -> None:
         """エクスポート機能の統合テスト。"""
-        import io
-        import json
-
-        df = load_sample_data()
+        df = sample_data
 
         # CSV エクスポート
         csv_buffer = io.StringIO()
@@ -132,39 +156,37 @@ class TestStreamlitIntegration:
         assert "sales" in csv_content
         assert "profit" in csv_content
 
-        # JSON エクスポート
-        json_buffer = io.StringIO()
-        df.to_json(json_buffer, orient="records", indent=2)
-        json_content = json_buffer.getvalue()
+        # JSON エクスポート（アプリのダウンロードと同じ書き出し処理を使う）
+        records = json.loads(_to_json_bytes(df))
 
-        assert len(json_content) > 0
-        parsed_json = json.loads(json_content)
-        assert isinstance(parsed_json, list)
-        assert len(parsed_json) == len(df)
+        assert isinstance(records, list)
+        assert len(records) == len(df)
+        assert list(records[0]) == list(df.columns)
 
         # サマリーエクスポート
         summary_data = {
             "overview": {
                 "total_rows": len(df),
                 "total_columns": len(df.columns),
-                "memory_usage_kb": df.memory_usage(deep=True).sum() / 1024,
-                "missing_values": df.isnull().sum().sum(),
+                "memory_usage_kb": sample_data_memory_bytes / 1024,
+                "missing_values": sample_data_quality["null_total"],
             },
             "columns": df.dtypes.astype(str).to_dict(),
-            "numeric_summary": df.describe().to_dict(),
+            "numeric_summary": sample_data_quality["describe"].to_dict(),
         }
 
         assert summary_data["overview"]["total_rows"] == 100
         assert summary_data["overview"]["missing_values"] == 0
         assert len(summary_data["columns"]) == len(df.columns)
 
-    def test_正常系_設定値との整合性チェック(self) -> None:
+    def test_正常系_設定値との整合性チェック(
+        self, sample_data_memory_bytes: int
+    ) -> None:
         """設定値とアプリケーション動作の整合性をチェック。"""
         config = AppConfig()
-        df = load_sample_data()
 
         # アップロードサイズ制限の確認
-        file_size_mb = df.memory_usage(deep=True).sum() / (1024 * 1024)
+        file_size_mb = sample_data_memory_bytes / (1024 * 1024)
         assert file_size_mb < config.max_upload_size_mb
 
         # ファイル形式の確認
@@ -176,10 +198,8 @@ class TestStreamlitIntegration:
         assert config.layout in ["wide", "centered"]
         assert config.initial_sidebar_state in ["auto", "expanded", "collapsed"]
 
-    def test_正常系_エラーハンドリングの統合(self) -> None:
+    def test_正常系_エラーハンドリングの統合(self, sample_data: pd.DataFrame) -> None:
         """エラーハンドリングの統合テスト。"""
-        from python_coding_test.streamlit.components.charts import create_bar_chart
-
         # 空のDataFrameでのエラーハンドリング
         empty_df = pd.DataFrame()
 
@@ -187,15 +207,13 @@ class TestStreamlitIntegration:
             create_bar_chart(empty_df, x_col="nonexistent", y_col="also_nonexistent")
 
         # 存在しない列でのエラーハンドリング
-        df = load_sample_data()
+        df = sample_data
 
         with pytest.raises(ValueError, match="Failed to create bar chart"):
             create_bar_chart(df, x_col="nonexistent_column", y_col="sales")
 
     def test_正常系_パフォーマンス要件の確認(self) -> None:
         """パフォーマンス要件の確認テスト。"""
-        import time
-
         # サンプルデータ生成のパフォーマンス
         start_time = time.time()
         df = load_sample_data()
@@ -206,8 +224,6 @@ class TestStreamlitIntegration:
         assert len(df) == 100
 
         # チャート作成のパフォーマンス
-        from python_coding_test.streamlit.components.charts import create_bar_chart
-
         start_time = time.time()
         fig = create_bar_chart(df, x_col="date", y_col="sales")
         chart_time = time.time() - start_time
@@ -0,0 +1,133 @@
+"""Tests for visualization page functionality."""
+
+import numpy as np
+import pandas as pd
+
+from python_coding_test.streamlit.pages.visualization import (
+    PLOT_LIMIT,
+    _build_mask,
+    _compact_dtypes,
+    _filter_meta,
+    _sample_for_plot,
+)
+
+
+class TestCompactDtypes:
+    """Test column dtype compaction."""
+
+    def test_正常系_値を保ったまま数値列が小さい型になる(self) -> None:
+        """整数列と誤差なく表せる小数列だけが縮小され、値が変わらないことを確認。"""
+        df = pd.DataFrame(
+            {
+                "count": [1, 2, 300],
+                "exact": [0.5, 1.25, None],
+                "inexact": [0.1, 0.2, 0.3],
+                "id": [f"id_{i}" for i in range(3)],
+            }
+        )
+
+        result = _compact_dtypes(df)
+
+        assert result["count"].dtype == np.int16
+        assert result["exact"].dtype == np.float32
+        assert result["inexact"].dtype == np.float64
+        pd.testing.assert_frame_equal(
+            result, df, check_dtype=False, check_categorical=False
+        )
+        assert df["count"].dtype == np.int64
+
+    def test_正常系_ユニーク値が少ない文字列列がカテゴリ型になる(self) -> None:
+        """ユニーク値が少ない文字列列だけがカテゴリ型に変換されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "region": ["North", "South"] * 50,
+                "user": [f"user_{i}" for i in range(100)],
+            }
+        )
+
+        result = _compact_dtypes(df)
+
+        assert isinstance(result["region"].dtype, pd.CategoricalDtype)
+        assert result["user"].dtype == object
+        assert result["region"].tolist() == df["region"].tolist()
+
+
+class TestFilterMeta:
+    """Test filter widget metadata."""
+
+    def test_正常系_数値範囲とカテゴリ値が計算される(self) -> None:
+        """値に幅のある数値列の範囲と刻み幅、カテゴリ列のユニーク値が返されることを確認。"""
+        df = pd.DataFrame(
+            {
+                "value": [3, 1, 2],
+                "constant": [5, 5, 5],
+                "category": ["A", "B", "A"],
+            }
+        )
+
+        meta = _filter_meta(df)
+
+        assert meta["all_cols"] == ["value", "constant", "category"]
+        assert meta["numeric_cols"] == ["value", "constant"]
+        assert meta["numeric"] == {"value": (1.0, 3.0, 0.02)}
+        assert meta["categorical"] == {"category": ["A", "B"]}
+
+    def test_正常系_ユニーク値が多い列はカテゴリフィルタから除外される(self) -> None:
+        """ユニーク値が上限を超える列にはカテゴリフィルタが作られないことを確認。"""
+        df = pd.DataFrame({"name": [f"user_{i}" for i in range(21)]})
+
+        meta = _filter_meta(df)
+
+        assert meta["categorical"] == {}
+
+
+class TestBuildMask:
+    """Test filter mask construction."""
+
+    def test_正常系_数値範囲とカテゴリ選択の両方を満たす行だけが残る(self) -> None:
+        """数値範囲とカテゴリ選択をAND条件で組み合わせたマスクになることを確認。"""
+        df = pd.DataFrame({"value": [1, 2, 3, 4], "group": ["A", "B", "A", "B"]})
+
+        mask = _build_mask(df, {"value": (2.0, 4.0)}, {"group": ["A"]})
+
+        assert mask.tolist() == [False, False, True, False]
+
+    def test_正常系_カテゴリ未選択の列は絞り込まない(self) -> None:
+        """カテゴリが1つも選択されていない列では行が除外されないことを確認。"""
+        df = pd.DataFrame({"group": ["A", "B"]})
+
+        mask = _build_mask(df, {}, {"group": []})
+
+        assert mask.all()
+
+
+class TestSampleForPlot:
+    """Test row sampling for chart payloads."""
+
+    def test_正常系_上限以下のデータはそのまま返される(self) -> None:
+        """行数が上限以下の場合は同じDataFrameが返されることを確認。"""
+        df = pd.DataFrame({"value": range(10)})
+
+        assert _sample_for_plot(df) is df
+
+    def test_正常系_上限を超えるデータは元の順序で間引かれる(self) -> None:
+        """上限を超える場合は上限件数に間引かれ、行の順序が保たれることを確認。"""
+        df = pd.DataFrame({"value": range(PLOT_LIMIT + 100)})
+
+        result = _sample_for_plot(df)
+
+        assert len(result) == PLOT_LIMIT
+        assert result.index.is_monotonic_increasing
+        pd.testing.assert_frame_equal(result, _sample_for_plot(df))
+
+    def test_正常系_シャッフルされたインデックスでも行の順序が保たれる(self) -> None:
+        """インデックスが昇順でない場合も、元の行の並びで間引かれることを確認。"""
+        rows = PLOT_LIMIT + 100
+        shuffled = np.random.default_rng(1).permutation(rows)
+        df = pd.DataFrame({"position": range(rows)}, index=shuffled)
+
+        result = _sample_for_plot(df)
+
+        assert len(result) == PLOT_LIMIT
+        assert result["position"].is_monotonic_increasing
+        assert result.index.isin(df.index).all()
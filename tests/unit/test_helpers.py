@@ -0,0 +1,67 @@
+"""Tests for JSON helper functions."""
+
+import numpy as np
+import pytest
+
+from python_coding_test.utils import helpers
+from python_coding_test.utils.helpers import dump_json_bytes, load_json_bytes
+
+_NON_FINITE = {
+    "nan": float("nan"),
+    "inf": np.float64("inf"),
+    "values": np.array([1.0, np.nan, -np.inf]),
+    "nested": {"rows": [np.float32("nan"), 2.5]},
+}
+
+
+@pytest.fixture
+def _without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """orjsonが無い環境を再現し、標準ライブラリのjsonを使わせる。"""
+    monkeypatch.setattr(helpers, "_HAS_ORJSON", False)
+
+
+class TestJsonBytesFallback:
+    """Test the stdlib fallback of the JSON byte helpers."""
+
+    @pytest.mark.usefixtures("_without_orjson")
+    def test_正常系_NaNと無限大がnullとして書き出される(self) -> None:
+        """標準ライブラリ版でもNaN・無限大がnullになることを確認。"""
+        restored = load_json_bytes(dump_json_bytes(_NON_FINITE, pretty=False))
+
+        assert restored == {
+            "nan": None,
+            "inf": None,
+            "values": [1.0, None, None],
+            "nested": {"rows": [None, 2.5]},
+        }
+
+    def test_正常系_標準ライブラリ版の出力がorjson版と一致する(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """orjsonの有無で同じJSONが読み戻せることを確認。"""
+        pytest.importorskip("orjson")
+        with_orjson = load_json_bytes(dump_json_bytes(_NON_FINITE))
+
+        monkeypatch.setattr(helpers, "_HAS_ORJSON", False)
+        without_orjson = load_json_bytes(dump_json_bytes(_NON_FINITE))
+
+        assert without_orjson == with_orjson
+
+    @pytest.mark.usefixtures("_without_orjson")
+    def test_正常系_numpy値と数値キーが書き出される(self) -> None:
+        """標準ライブラリ版でもnumpy値と数値キーを扱えることを確認。"""
+        data = {0: np.int64(3), "values": np.array([1, 2])}
+
+        assert load_json_bytes(dump_json_bytes(data)) == {"0": 3, "values": [1, 2]}
+
+    @pytest.mark.usefixtures("_without_orjson")
+    def test_異常系_NaNトークンを含むJSONでValueError(self) -> None:
+        """標準ライブラリ版でもNaNトークンが不正なJSONとして扱われることを確認。"""
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            load_json_bytes(b'{"value": NaN}')
+
+    @pytest.mark.usefixtures("_without_orjson")
+    def test_異常系_シリアライズできない値でValueError(self) -> None:
+        """標準ライブラリ版でも変換できない値でValueErrorになることを確認。"""
+        with pytest.raises(ValueError, match="not JSON serializable"):
+            dump_json_bytes({"value": object()})